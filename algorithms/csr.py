@@ -0,0 +1,280 @@
+"""
+Compressed sparse row (CSR) graphs with integer node ids.
+
+Nodes are numbered 0..n-1. The out-edges of node ``u`` are
+``targets[offsets[u]:offsets[u + 1]]`` with the matching slice of
+``weights``. The three arrays are typed ``array.array`` buffers (4 bytes per
+target and per small integer weight), so an edge costs a few bytes instead
+of the hundreds a dict-of-dicts entry does, and ``to_numpy`` exposes them to
+NumPy without copying. Undirected graphs store each edge in both directions.
+"""
+import threading
+from array import array
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; to_numpy is unavailable without it
+    np = None
+
+
+def _index_typecode(limit):
+    return 'i' if limit < 2 ** 31 else 'q'
+
+
+def _weight_typecode(weights):
+    if all(isinstance(w, int) for w in weights):
+        if all(-2 ** 31 <= w < 2 ** 31 for w in weights):
+            return 'i'
+        return 'q'
+    return 'd'
+
+
+class CSRGraph:
+    """Immutable graph in CSR form.
+
+    ``labels`` keeps the original node names of a converted graph (or is
+    None when the ids are the names); algorithms take and return labels.
+    """
+
+    def __init__(self, offsets, targets, weights=None, labels=None, directed=True):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.labels = labels
+        self.directed = directed
+        self.n = len(offsets) - 1
+        self._ids = None
+        self._numpy = None
+        self._reverse = None
+        # (count, tables) of ALT landmark distances, set by
+        # shortest_path.landmark_tables; unlike the caches it is pickled
+        self.landmarks = None
+
+    # --- Construction ---------------------------------------------------------
+
+    @classmethod
+    def from_arrays(cls, n, sources, targets, weights=None, directed=True, labels=None):
+        """Build from parallel edge lists ``sources[i] -> targets[i]`` (counting sort by source)."""
+        if not directed:
+            sources, targets = list(sources) + list(targets), list(targets) + list(sources)
+            if weights is not None:
+                weights = list(weights) * 2
+        m = len(sources)
+        counts = [0] * (n + 1)
+        for u in sources:
+            counts[u + 1] += 1
+        for u in range(n):
+            counts[u + 1] += counts[u]
+        offsets = array('q', counts)
+        cursor = counts[:n]
+        slot_of = [0] * m
+        for i, u in enumerate(sources):
+            slot_of[i] = cursor[u]
+            cursor[u] += 1
+        ordered_targets = [0] * m
+        for i, v in enumerate(targets):
+            ordered_targets[slot_of[i]] = v
+        csr_targets = array(_index_typecode(n), ordered_targets)
+        csr_weights = None
+        if weights is not None:
+            ordered_weights = [0] * m
+            for i, w in enumerate(weights):
+                ordered_weights[slot_of[i]] = w
+            csr_weights = array(_weight_typecode(ordered_weights), ordered_weights)
+        return cls(offsets, csr_targets, csr_weights, labels=labels, directed=directed)
+
+    @classmethod
+    def from_edges(cls, edges, nodes=None, directed=False):
+        """Build from ``(u, v)`` or ``(u, v, weight)`` tuples.
+
+        Node names are kept as labels unless they already are the ids
+        0..n-1 and no ``nodes`` list is given.
+        """
+        edges = [tuple(edge) for edge in edges]
+        weighted = any(len(edge) > 2 for edge in edges)
+        endpoints = [x for edge in edges for x in edge[:2]]
+        if nodes is None and all(isinstance(x, int) and x >= 0 for x in endpoints):
+            labels = None
+            n = max(endpoints) + 1 if endpoints else 0
+            ids = None
+        else:
+            labels = list(nodes or [])
+            ids = {label: i for i, label in enumerate(labels)}
+            for x in endpoints:
+                if x not in ids:
+                    ids[x] = len(labels)
+                    labels.append(x)
+            n = len(labels)
+        sources = [e[0] if ids is None else ids[e[0]] for e in edges]
+        targets = [e[1] if ids is None else ids[e[1]] for e in edges]
+        weights = [e[2] if len(e) > 2 else 1 for e in edges] if weighted else None
+        return cls.from_arrays(n, sources, targets, weights, directed=directed, labels=labels)
+
+    @classmethod
+    def from_adjacency(cls, adjacency):
+        """Build a directed CSR from ``{u: [v, ...]}``, ``{u: [(v, w), ...]}`` or ``{u: {v: w}}``."""
+        labels = list(adjacency)
+        ids = {label: i for i, label in enumerate(labels)}
+        sources, targets, weights = [], [], []
+        weighted = False
+        for u, neighbors in adjacency.items():
+            items = neighbors.items() if isinstance(neighbors, dict) else neighbors
+            for entry in items:
+                if isinstance(entry, (tuple, list)):
+                    v, w = entry[0], entry[1]
+                    weighted = True
+                else:
+                    v, w = entry, 1
+                if v not in ids:
+                    ids[v] = len(labels)
+                    labels.append(v)
+                sources.append(ids[u])
+                targets.append(ids[v])
+                weights.append(w)
+        return cls.from_arrays(len(labels), sources, targets, weights if weighted else None,
+                               directed=True, labels=labels)
+
+    # --- Access -----------------------------------------------------------------
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def num_edges(self):
+        """Stored (directed) edges; an undirected edge counts twice."""
+        return len(self.targets)
+
+    def node_id(self, label):
+        """Integer id of a node name (ids are their own names without labels)."""
+        if self.labels is None:
+            return label
+        if self._ids is None:
+            self._ids = {name: i for i, name in enumerate(self.labels)}
+        return self._ids[label]
+
+    def label(self, node):
+        return node if self.labels is None else self.labels[node]
+
+    def neighbors(self, u):
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def out_edges(self, u):
+        """``(v, weight)`` pairs of node ``u``; weight 1 for unweighted graphs."""
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        if self.weights is None:
+            return [(v, 1) for v in self.targets[lo:hi]]
+        return list(zip(self.targets[lo:hi], self.weights[lo:hi]))
+
+    def edges(self):
+        """All stored ``(u, v, weight)`` edges in CSR order."""
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        for u in range(self.n):
+            for i in range(offsets[u], offsets[u + 1]):
+                yield u, targets[i], (1 if weights is None else weights[i])
+
+    def to_numpy(self):
+        """``(offsets, targets, weights)`` as NumPy views of the CSR buffers (no copy)."""
+        if np is None:
+            raise ImportError("CSRGraph.to_numpy requires NumPy")
+        if self._numpy is None:
+            weights = None
+            if self.weights is not None:
+                weights = np.frombuffer(self.weights, dtype={'i': np.int32, 'q': np.int64,
+                                                             'd': np.float64}[self.weights.typecode])
+            self._numpy = (np.frombuffer(self.offsets, dtype=np.int64),
+                           np.frombuffer(self.targets, dtype=np.int32 if self.targets.typecode == 'i'
+                                         else np.int64),
+                           weights)
+        return self._numpy
+
+    def reverse(self):
+        """Graph with every edge flipped (cached; an undirected graph is its own reverse)."""
+        if not self.directed:
+            return self
+        if self._reverse is None:
+            offsets = self.offsets
+            sources = [u for u in range(self.n) for _ in range(offsets[u + 1] - offsets[u])]
+            self._reverse = CSRGraph.from_arrays(self.n, self.targets, sources, self.weights,
+                                                 directed=True, labels=self.labels)
+        return self._reverse
+
+    @property
+    def nbytes(self):
+        total = self.offsets.itemsize * len(self.offsets) + self.targets.itemsize * len(self.targets)
+        if self.weights is not None:
+            total += self.weights.itemsize * len(self.weights)
+        if self.landmarks is not None:
+            total += sum(t.itemsize * len(t) for pair in self.landmarks[1] for t in pair)
+        return total
+
+    def __sizeof__(self):
+        # Counted by deep_sizeof / sys.getsizeof for the input cache budgets
+        return object.__sizeof__(self) + self.nbytes
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_ids'] = None
+        state['_numpy'] = None
+        state['_reverse'] = None
+        return state
+
+    def __repr__(self):
+        kind = "directed" if self.directed else "undirected"
+        return (f"CSRGraph(n={self.n}, edges={self.num_edges}, {kind}, "
+                f"{'weighted' if self.weights is not None else 'unweighted'})")
+
+
+# Conversions are cached by the identity of the source object; the source is
+# kept alive with its CSR so the id cannot be reused. Like cached battle
+# inputs, converted graphs must not be mutated afterwards.
+_conversions = OrderedDict()  # id(source) -> (source, CSRGraph)
+_conversions_lock = threading.Lock()
+CONVERSION_CACHE_ENTRIES = 16
+
+
+def as_csr(graph):
+    """CSR form of a CSRGraph, dict adjacency or edge list (converted once, then cached).
+
+    Edge lists are taken as undirected, adjacency dicts as directed.
+    """
+    if isinstance(graph, CSRGraph):
+        return graph
+    key = id(graph)
+    with _conversions_lock:
+        entry = _conversions.get(key)
+        if entry is not None and entry[0] is graph:
+            _conversions.move_to_end(key)
+            return entry[1]
+    if isinstance(graph, dict):
+        csr = CSRGraph.from_adjacency(graph)
+    else:
+        csr = CSRGraph.from_edges(graph)
+    with _conversions_lock:
+        _conversions[key] = (graph, csr)
+        while len(_conversions) > CONVERSION_CACHE_ENTRIES:
+            _conversions.popitem(last=False)
+    return csr
+
+
+def relabel_order(graph, order):
+    """Map a list of node ids back to node names."""
+    if graph.labels is None:
+        return order
+    labels = graph.labels
+    return [labels[u] for u in order]
+
+
+def relabel_distances(graph, dist):
+    """Distances indexed by id: a list for plain ids, ``{name: distance}`` for labelled graphs."""
+    if graph.labels is None:
+        return dist
+    return dict(zip(graph.labels, dist))
+
+
+def relabel_edges(graph, edges):
+    """Map ``(u, v, weight)`` edges back to node names."""
+    if graph.labels is None:
+        return edges
+    labels = graph.labels
+    return [(labels[u], labels[v], w) for u, v, w in edges]
@@ -1,7 +1,15 @@
-import heapq
 from collections import deque
 
+from algorithms.csr import as_csr, relabel_order, relabel_distances
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; bfs_numpy is unavailable without it
+    np = None
+
 def bfs(graph, start):
+    if not isinstance(graph, dict):
+        return _bfs_csr(as_csr(graph), start)
     visited = set()
     queue = deque([start])
     order = []
@@ -19,6 +27,8 @@ def bfs(graph, start):
     return order, comparisons
 
 def dfs(graph, start):
+    if not isinstance(graph, dict):
+        return _dfs_csr(as_csr(graph), start)
     visited = set()
     stack = [start]
     order = []
@@ -36,3 +46,157 @@ def dfs(graph, start):
     return order, comparisons
 
 
+# --- CSR code paths (CSRGraph or edge-list input) ------------------------------
+# Same visit order as the dict versions, with a bytearray visited map over
+# integer ids. BFS marks nodes when they are discovered, so each node is
+# queued once.
+
+def _bfs_csr(graph, start):
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.n)
+    source = graph.node_id(start)
+    visited[source] = 1
+    queue = deque([source])
+    order = []
+    comparisons = 0
+    while queue:
+        node = queue.popleft()
+        comparisons += 1
+        order.append(node)
+        for i in range(offsets[node], offsets[node + 1]):
+            comparisons += 1
+            nb = targets[i]
+            if not visited[nb]:
+                visited[nb] = 1
+                queue.append(nb)
+    return relabel_order(graph, order), comparisons
+
+def _dfs_csr(graph, start):
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.n)
+    stack = [graph.node_id(start)]
+    order = []
+    comparisons = 0
+    while stack:
+        node = stack.pop()
+        comparisons += 1
+        if not visited[node]:
+            visited[node] = 1
+            order.append(node)
+            lo, hi = offsets[node], offsets[node + 1]
+            comparisons += hi - lo
+            stack.extend(reversed(targets[lo:hi]))  # reverse for typical order
+    return relabel_order(graph, order), comparisons
+
+
+# --- Frontier traversals ---------------------------------------------------------
+# Work on CSR (dicts and edge lists are converted once via as_csr), mark nodes
+# on discovery so each is queued exactly once, and count edge inspections:
+# one per adjacency entry scanned.
+
+def bfs_frontier(graph, start):
+    """Level-synchronous BFS: expand the whole frontier, then swap in the next one.
+
+    Returns ((order, levels), edge_inspections) where ``levels`` is each
+    node's BFS depth (-1 if unreachable).
+    """
+    graph = as_csr(graph)
+    offsets = graph.offsets
+    edges = memoryview(graph.targets)
+    visited = bytearray(graph.n)
+    levels = [-1] * graph.n
+    source = graph.node_id(start)
+    visited[source] = 1
+    levels[source] = 0
+    order = [source]
+    frontier = [source]
+    inspections = 0
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for u in frontier:
+            lo, hi = offsets[u], offsets[u + 1]
+            inspections += hi - lo
+            for v in edges[lo:hi]:
+                if not visited[v]:
+                    visited[v] = 1
+                    levels[v] = depth
+                    next_frontier.append(v)
+        order.extend(next_frontier)
+        frontier = next_frontier
+    return (relabel_order(graph, order), relabel_distances(graph, levels)), inspections
+
+
+def bfs_numpy(graph, start):
+    """Level-synchronous BFS with each frontier expanded by NumPy array operations.
+
+    All out-edges of the frontier are gathered in one fancy-indexing step,
+    filtered against a boolean visited map and de-duplicated keeping first
+    occurrences, so the visit order matches ``bfs_frontier``.
+    Returns ((order, levels), edge_inspections)
+    """
+    if np is None:
+        raise ImportError("bfs_numpy requires NumPy")
+    graph = as_csr(graph)
+    offsets, targets, _ = graph.to_numpy()
+    visited = np.zeros(graph.n, dtype=bool)
+    levels = np.full(graph.n, -1, dtype=np.int64)
+    source = graph.node_id(start)
+    visited[source] = True
+    levels[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    chunks = [frontier]
+    inspections = 0
+    depth = 0
+    while frontier.size:
+        depth += 1
+        starts = offsets[frontier]
+        counts = offsets[frontier + 1] - starts
+        total = int(counts.sum())
+        inspections += total
+        if total == 0:
+            break
+        # Edge slots of every frontier node: start of its run + position within it
+        run_starts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        neighbors = targets[run_starts + np.arange(total)]
+        neighbors = neighbors[~visited[neighbors]]
+        _, first = np.unique(neighbors, return_index=True)
+        frontier = neighbors[np.sort(first)].astype(np.int64)
+        visited[frontier] = True
+        levels[frontier] = depth
+        chunks.append(frontier)
+    order = np.concatenate(chunks).tolist()
+    return (relabel_order(graph, order), relabel_distances(graph, levels.tolist())), inspections
+
+
+def dfs_iterative(graph, start):
+    """Iterative DFS with an explicit stack of edge cursors.
+
+    Each stack entry is an iterator over a zero-copy memoryview slice of the
+    node's out-edges, so a node resumes its scan where it stopped and no
+    neighbor lists are copied or reversed. Nodes are marked when first
+    reached and pushed once; visits nodes in the same preorder as ``dfs``.
+    Every visited node's edges are scanned exactly once before it is popped,
+    so the inspection count is the sum of their out-degrees.
+    Returns (order, edge_inspections)
+    """
+    graph = as_csr(graph)
+    offsets = graph.offsets
+    edges = memoryview(graph.targets)
+    visited = bytearray(graph.n)
+    source = graph.node_id(start)
+    visited[source] = 1
+    order = [source]
+    stack = [iter(edges[offsets[source]:offsets[source + 1]])]
+    while stack:
+        for v in stack[-1]:
+            if not visited[v]:
+                visited[v] = 1
+                order.append(v)
+                stack.append(iter(edges[offsets[v]:offsets[v + 1]]))
+                break
+        else:
+            stack.pop()
+    inspections = sum(offsets[u + 1] - offsets[u] for u in order)
+    return relabel_order(graph, order), inspections
@@ -1,6 +1,14 @@
 """
 Implementation of 0/1 Knapsack algorithms using different approaches
 """
+import bisect
+import heapq
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the vectorized engines are skipped without it
+    np = None
 
 def knapsack_dp(values, weights, capacity):
     """0/1 Knapsack using Dynamic Programming approach
@@ -31,9 +39,52 @@ def knapsack_dp(values, weights, capacity):
         
     return (dp[n][capacity], selected), comparisons
 
+def knapsack_dp_numpy(values, weights, capacity):
+    """0/1 Knapsack DP vectorized with NumPy over a single rolling row
+    Time complexity: O(nW) but each item is one array operation
+    Space complexity: O(W) for values plus n*W bits of decisions
+
+    For item i the row is updated as dp[w:] = max(dp[w:], dp[:-w] + v); the
+    right-hand side is evaluated before assignment, so each item is used at
+    most once. Whether the item was taken at each capacity is recorded in a
+    bit-packed decision matrix, which is all the backtrack needs.
+    """
+    if np is None:
+        raise ImportError("knapsack_dp_numpy requires NumPy")
+    n = len(values)
+    dtype = np.int64 if all(isinstance(v, int) for v in values) else np.float64
+    dp = np.zeros(capacity + 1, dtype=dtype)
+    decisions = np.zeros((n, (capacity + 8) // 8), dtype=np.uint8)
+    taken = np.zeros(capacity + 1, dtype=bool)
+    comparisons = 0
+
+    for i in range(n):
+        w, v = weights[i], values[i]
+        comparisons += capacity + 1
+        if w > capacity:
+            continue
+        candidate = dp[:capacity + 1 - w] + v
+        taken[:w] = False
+        np.greater(candidate, dp[w:], out=taken[w:])
+        np.maximum(dp[w:], candidate, out=dp[w:])
+        decisions[i] = np.packbits(taken)
+
+    # Backtrack through the decision bits (packbits is big-endian per byte)
+    selected = []
+    j = capacity
+    for i in range(n - 1, -1, -1):
+        if j <= 0:
+            break
+        comparisons += 1
+        if (decisions[i, j >> 3] >> (7 - (j & 7))) & 1:
+            selected.append(i)
+            j -= weights[i]
+
+    return (dp[capacity].item(), selected), comparisons
+
 def knapsack_backtracking(values, weights, capacity):
-    """0/1 Knapsack using Backtracking with memoization
-    Time complexity: O(2^n) worst case, but much better with memoization
+    """0/1 Knapsack using plain Backtracking (exhaustive, no memoization)
+    Time complexity: O(2^n); see knapsack_memoized for the memoized version
     Space complexity: O(n) for recursion stack
     """
     n = len(values)
@@ -66,6 +117,60 @@ def knapsack_backtracking(values, weights, capacity):
     backtrack(0, 0, 0, [])
     return (max_value[0], best_selection[0]), comparisons
 
+def knapsack_memoized(values, weights, capacity):
+    """0/1 Knapsack using memoized top-down search on an explicit stack
+    Time complexity: O(n * W) distinct (index, remaining) states at most
+    Space complexity: O(n * W) for the memo
+
+    Same include/exclude recursion as backtracking, but each (index,
+    remaining capacity) state is solved once. The recursion is driven by an
+    explicit stack, so large n cannot hit Python's recursion limit, and each
+    memo entry stores (best value, selection bitmask) for the suffix.
+    """
+    n = len(values)
+    stride = capacity + 1
+    memo = {}
+    comparisons = 0
+    stack = [(0, capacity)]
+
+    while stack:
+        index, remaining = stack[-1]
+        key = index * stride + remaining
+        if key in memo:
+            stack.pop()
+            continue
+        if index == n:
+            memo[key] = (0, 0)
+            stack.pop()
+            continue
+
+        skip_key = key + stride  # (index + 1, remaining)
+        fits = weights[index] <= remaining
+        take_key = skip_key - weights[index]  # (index + 1, remaining - weight)
+        pending = False
+        if skip_key not in memo:
+            stack.append((index + 1, remaining))
+            pending = True
+        if fits and take_key not in memo:
+            stack.append((index + 1, remaining - weights[index]))
+            pending = True
+        if pending:
+            continue  # solve the children first, then revisit this state
+
+        stack.pop()
+        comparisons += 1
+        best = memo[skip_key]
+        if fits:
+            take_value, take_mask = memo[take_key]
+            take_value += values[index]
+            if take_value > best[0]:
+                best = (take_value, take_mask | (1 << index))
+        memo[key] = best
+
+    best_value, mask = memo[capacity]
+    selected = [i for i in range(n) if (mask >> i) & 1]
+    return (best_value, selected), comparisons
+
 def knapsack_branch_bound(values, weights, capacity):
     """0/1 Knapsack using Branch and Bound approach
     Uses value per unit weight as bound
@@ -124,4 +229,201 @@ def knapsack_branch_bound(values, weights, capacity):
             branch_and_bound(index + 1, curr_value, curr_weight, selected)
     
     branch_and_bound(0, 0, 0, [])
-    return (max_value[0], sorted(best_selection[0])), comparisons
\ No newline at end of file
+    return (max_value[0], sorted(best_selection[0])), comparisons
+
+def knapsack_branch_bound_best_first(values, weights, capacity):
+    """0/1 Knapsack using best-first Branch and Bound with a priority queue
+    Time complexity: O(2^n) worst case, O(log n) per bound, far fewer nodes in practice
+    Space complexity: O(number of open nodes)
+
+    Nodes are expanded in order of their fractional (LP) upper bound from a
+    heapq. Bounds come from prefix sums of the ratio-sorted weights/values
+    plus one bisect, selections are int bitmasks over sorted positions, and
+    the search stops as soon as the best open bound cannot beat the
+    incumbent - at that point the incumbent is optimal.
+    """
+    n = len(values)
+    order = sorted(range(n), key=lambda i: -values[i] / weights[i] if weights[i] else -float('inf'))
+    vals = [values[i] for i in order]
+    wts = [weights[i] for i in order]
+    prefix_w = [0]
+    prefix_v = [0]
+    for v, w in zip(vals, wts):
+        prefix_w.append(prefix_w[-1] + w)
+        prefix_v.append(prefix_v[-1] + v)
+    integral = all(isinstance(v, int) for v in values)
+    comparisons = 0
+
+    def bound(index, value, weight):
+        """LP bound for items index.. with capacity - weight left."""
+        remaining = capacity - weight
+        # Last prefix that still fits entirely
+        j = bisect.bisect_right(prefix_w, prefix_w[index] + remaining, index) - 1
+        result = value + prefix_v[j] - prefix_v[index]
+        if j < n:
+            result += (remaining - (prefix_w[j] - prefix_w[index])) * vals[j] / wts[j]
+        # The optimum is an integer when all values are
+        return math.floor(result) if integral else result
+
+    best_value, best_mask = 0, 0
+    heap = [(-bound(0, 0, 0), 0, 0, 0, 0)]  # (-bound, -depth, value, weight, mask)
+    while heap:
+        neg_bound, neg_depth, value, weight, mask = heapq.heappop(heap)
+        comparisons += 1
+        if -neg_bound <= best_value:
+            break  # no open node can improve on the incumbent
+        index = -neg_depth
+        if index >= n:
+            continue
+        # Include item `index`
+        w = weight + wts[index]
+        if w <= capacity:
+            v = value + vals[index]
+            child_mask = mask | (1 << index)
+            if v > best_value:
+                best_value, best_mask = v, child_mask
+            b = bound(index + 1, v, w)
+            if b > best_value:
+                heapq.heappush(heap, (-b, -(index + 1), v, w, child_mask))
+        # Exclude item `index`
+        b = bound(index + 1, value, weight)
+        if b > best_value:
+            heapq.heappush(heap, (-b, -(index + 1), value, weight, mask))
+
+    selected = sorted(order[k] for k in range(n) if (best_mask >> k) & 1)
+    return (best_value, selected), comparisons
+
+
+def knapsack_dp_by_value(values, weights, capacity):
+    """0/1 Knapsack using DP over total value instead of capacity
+    Time complexity: O(n * sum(values)), independent of the capacity
+    Space complexity: O(sum(values)) plus n*sum(values) decision bits
+
+    min_weight[v] is the lightest subset worth exactly v. Suited to large
+    capacities with small integer values, where O(nW) tables are hopeless.
+    Decisions are kept as one int bitset per item for the backtrack.
+    """
+    n = len(values)
+    total = sum(values)
+    inf = float('inf')
+    min_weight = [0] + [inf] * total
+    decisions = []
+    comparisons = 0
+    reachable = 0  # highest value reachable so far
+
+    for i in range(n):
+        v, w = values[i], weights[i]
+        taken = 0
+        # Descending so every item is used at most once
+        for t in range(reachable, -1, -1):
+            comparisons += 1
+            candidate = min_weight[t] + w
+            if candidate < min_weight[t + v] and candidate <= capacity:
+                min_weight[t + v] = candidate
+                taken |= 1 << (t + v)
+        decisions.append(taken)
+        reachable = min(total, reachable + v)
+
+    best = max(t for t in range(reachable + 1) if min_weight[t] <= capacity)
+
+    selected = []
+    t = best
+    for i in range(n - 1, -1, -1):
+        comparisons += 1
+        if (decisions[i] >> t) & 1:
+            selected.append(i)
+            t -= values[i]
+
+    return (best, selected), comparisons
+
+
+def knapsack_pareto(values, weights, capacity):
+    """0/1 Knapsack using a sparse Pareto-frontier (dominance-pruned) DP
+    Time complexity: O(n * F) where F is the frontier size (<= min(2^n, W))
+    Space complexity: O(F)
+
+    The frontier holds only states (weight, value, selection bitmask) that no
+    other state beats with less-or-equal weight and more-or-equal value. Each
+    item produces a shifted copy of the frontier that is merged back in
+    weight order, dropping dominated states on the fly.
+    """
+    n = len(values)
+    frontier = [(0, 0, 0)]  # sorted by weight, strictly increasing value
+    comparisons = 0
+
+    for i in range(n):
+        v, w, bit = values[i], weights[i], 1 << i
+        shifted = [(sw + w, sv + v, mask | bit) for sw, sv, mask in frontier if sw + w <= capacity]
+        merged = []
+        a = b = 0
+        best_value = -1
+        while a < len(frontier) or b < len(shifted):
+            comparisons += 1
+            if b >= len(shifted) or (a < len(frontier) and
+                                     (frontier[a][0], -frontier[a][1]) <= (shifted[b][0], -shifted[b][1])):
+                state = frontier[a]
+                a += 1
+            else:
+                state = shifted[b]
+                b += 1
+            # Lighter states were emitted first, so keep only value improvements
+            if state[1] > best_value:
+                merged.append(state)
+                best_value = state[1]
+        frontier = merged
+
+    _, best, mask = frontier[-1]
+    selected = [i for i in range(n) if (mask >> i) & 1]
+    return (best, selected), comparisons
+
+
+def _enumerate_half(values, weights):
+    """All subset (weight, value) sums of one half; list index == subset bitmask."""
+    sub_weights, sub_values = [0], [0]
+    for v, w in zip(values, weights):
+        sub_weights += [sw + w for sw in sub_weights]
+        sub_values += [sv + v for sv in sub_values]
+    return sub_weights, sub_values
+
+
+def knapsack_meet_in_middle(values, weights, capacity):
+    """0/1 Knapsack using meet-in-the-middle over two half enumerations
+    Time complexity: O(2^(n/2) * n), practical up to about n = 40
+    Space complexity: O(2^(n/2))
+
+    Both halves are enumerated (a subset's bitmask is its list index). The
+    second half is sorted by weight and reduced to a Pareto list, so each
+    first-half subset finds its best partner with one bisect on the remaining
+    capacity.
+    """
+    n = len(values)
+    half = n // 2
+    weights_a, values_a = _enumerate_half(values[:half], weights[:half])
+    weights_b, values_b = _enumerate_half(values[half:], weights[half:])
+    comparisons = len(weights_a) + len(weights_b)
+
+    # Pareto list of the second half: increasing weight and value
+    pareto_weights, pareto_values, pareto_masks = [], [], []
+    for mask in sorted(range(len(weights_b)), key=lambda m: (weights_b[m], -values_b[m])):
+        comparisons += 1
+        if weights_b[mask] > capacity:
+            break
+        if not pareto_values or values_b[mask] > pareto_values[-1]:
+            pareto_weights.append(weights_b[mask])
+            pareto_values.append(values_b[mask])
+            pareto_masks.append(mask)
+
+    best, best_a, best_b = 0, 0, 0
+    for mask_a in range(len(weights_a)):
+        remaining = capacity - weights_a[mask_a]
+        if remaining < 0:
+            continue
+        comparisons += 1
+        j = bisect.bisect_right(pareto_weights, remaining) - 1
+        if j >= 0 and values_a[mask_a] + pareto_values[j] > best:
+            best = values_a[mask_a] + pareto_values[j]
+            best_a, best_b = mask_a, pareto_masks[j]
+
+    selected = [i for i in range(half) if (best_a >> i) & 1]
+    selected += [half + i for i in range(n - half) if (best_b >> i) & 1]
+    return (best, selected), comparisons
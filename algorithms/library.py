@@ -1,44 +1,97 @@
+from types import MappingProxyType
 
+try:
+    import numpy  # noqa: F401  (optional dependency)
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
 
-from algorithms.sorting import bubble_sort, insertion_sort, merge_sort, quick_sort, selection_sort, heap_sort
+from algorithms.sorting import (bubble_sort, insertion_sort, merge_sort, quick_sort, selection_sort, heap_sort,
+                                merge_sort_bottom_up, introsort, heap_sort_inplace)
 from algorithms.searching import linear_search, binary_search, fibonacci_search
-from algorithms.shortest_path import dijkstra, bellman_ford, floyd_warshall
+from algorithms.shortest_path import (dijkstra, bellman_ford, bellman_ford_numpy, spfa, floyd_warshall,
+                                      floyd_warshall_numpy, dijkstra_dary, dial_dijkstra, bidirectional_dijkstra,
+                                      astar_landmarks)
 from algorithms.mcst import prim, kruskal
-from algorithms.graph import bfs, dfs
-from algorithms.string_matching import naive_search, kmp_search, rabin_karp, boyer_moore
+from algorithms.graph import bfs, dfs, bfs_frontier, bfs_numpy, dfs_iterative
+from algorithms.string_matching import (naive_search, kmp_search, rabin_karp, boyer_moore, horspool, sunday,
+                                       rabin_karp_64, rabin_karp_multi, aho_corasick, multi_naive_search,
+                                       multi_kmp_search)
 from algorithms.subset import subset_bitmasking, subset_backtracking, subset_recursive, subset_iterative, subset_builtin
-from algorithms.knapsack import knapsack_dp, knapsack_backtracking, knapsack_branch_bound
+from algorithms.knapsack import (knapsack_dp, knapsack_dp_numpy, knapsack_backtracking, knapsack_branch_bound,
+                                 knapsack_branch_bound_best_first, knapsack_memoized,
+                                 knapsack_dp_by_value, knapsack_pareto, knapsack_meet_in_middle)
+from algorithms.standard_library import (python_builtin_sort, heapq_sort, numpy_sort, numpy_sort_stable,
+                                         numpy_heap_sort, builtin_linear_search, bisect_search,
+                                         numpy_linear_search, numpy_binary_search, str_find_search, regex_search)
+
+# Implementation tiers, slowest first. An entry's own "func" is its custom
+# tier; the others are declared per entry in "tiers" (see AlgorithmRegistry).
+TIERS = ("custom", "builtin", "numpy")
+TIER_LABELS = {"custom": "Custom", "builtin": "Python Built-in", "numpy": "NumPy"}
+
+
+def tiers(builtin=None, numpy=None):
+    """Built-in/NumPy counterparts of an entry; the numpy tier needs NumPy installed."""
+    declared = {"builtin": builtin}
+    if HAVE_NUMPY:
+        declared["numpy"] = numpy
+    return {tier: func for tier, func in declared.items() if func is not None}
 
 
 
 algorithms = {
     "string matching": [
-        {"key": "naive_search", "name": "Naive Search", "func": naive_search, "category": "String Matching", "type": "custom"},
+        {"key": "naive_search", "name": "Naive Search", "func": naive_search, "category": "String Matching", "type": "custom",
+         "tiers": tiers(builtin=regex_search)},
         {"key": "kmp_search", "name": "KMP Search", "func": kmp_search, "category": "String Matching", "type": "custom"},
         {"key": "rabin_karp", "name": "Rabin-Karp", "func": rabin_karp, "category": "String Matching", "type": "custom"},
-        {"key": "boyer_moore", "name": "Boyer-Moore", "func": boyer_moore, "category": "String Matching", "type": "custom"},
+        {"key": "rabin_karp_64", "name": "Rabin-Karp (64-bit)", "func": rabin_karp_64, "category": "String Matching", "type": "custom"},
+        {"key": "boyer_moore", "name": "Boyer-Moore", "func": boyer_moore, "category": "String Matching", "type": "custom",
+         "tiers": tiers(builtin=str_find_search)},
+        {"key": "horspool", "name": "Boyer-Moore-Horspool", "func": horspool, "category": "String Matching", "type": "custom"},
+        {"key": "sunday", "name": "Sunday (Quick Search)", "func": sunday, "category": "String Matching", "type": "custom"},
+    ],
+    "multi-pattern matching": [
+        {"key": "aho_corasick", "name": "Aho-Corasick", "func": aho_corasick, "type": "custom"},
+        {"key": "rabin_karp_multi", "name": "Rabin-Karp (Hash Set)", "func": rabin_karp_multi, "type": "custom"},
+        # Baselines: one full pass per pattern
+        {"key": "multi_naive_search", "name": "Naive Search per Pattern", "func": multi_naive_search, "type": "custom"},
+        {"key": "multi_kmp_search", "name": "KMP per Pattern", "func": multi_kmp_search, "type": "custom"},
     ],
     "sorting": [
         {"key": "bubble_sort", "name": "Bubble Sort", "func": bubble_sort, "type": "custom"},
         {"key": "insertion_sort", "name": "Insertion Sort", "func": insertion_sort, "type": "custom"},
-        {"key": "merge_sort", "name": "Merge Sort", "func": merge_sort, "type": "custom"},
-        {"key": "quick_sort", "name": "Quick Sort", "func": quick_sort, "type": "custom"},
+        {"key": "merge_sort", "name": "Merge Sort", "func": merge_sort, "type": "custom",
+         "tiers": tiers(builtin=python_builtin_sort, numpy=numpy_sort_stable)},
+        {"key": "quick_sort", "name": "Quick Sort", "func": quick_sort, "type": "custom",
+         "tiers": tiers(numpy=numpy_sort)},
         {"key": "selection_sort", "name": "Selection Sort", "func": selection_sort, "type": "custom"},
-        {"key": "heap_sort", "name": "Heap Sort", "func": heap_sort, "type": "custom"},
+        {"key": "heap_sort", "name": "Heap Sort", "func": heap_sort, "type": "custom",
+         "tiers": tiers(builtin=heapq_sort, numpy=numpy_heap_sort)},
         # Optimized implementations
-        
+        {"key": "merge_sort_bottom_up", "name": "Bottom-Up Merge Sort", "func": merge_sort_bottom_up, "type": "optimized"},
+        {"key": "introsort", "name": "Introsort", "func": introsort, "type": "optimized"},
+        {"key": "heap_sort_inplace", "name": "In-Place Heap Sort", "func": heap_sort_inplace, "type": "optimized"},
     ],
     "searching": [
-        {"key": "linear_search", "name": "Linear Search", "func": linear_search, "type": "custom"},
-        {"key": "binary_search", "name": "Binary Search", "func": binary_search, "type": "custom"},
+        {"key": "linear_search", "name": "Linear Search", "func": linear_search, "type": "custom",
+         "tiers": tiers(builtin=builtin_linear_search, numpy=numpy_linear_search)},
+        {"key": "binary_search", "name": "Binary Search", "func": binary_search, "type": "custom",
+         "tiers": tiers(builtin=bisect_search, numpy=numpy_binary_search)},
         {"key": "fibonacci_search", "name": "Fibonacci Search", "func": fibonacci_search, "type": "custom"},
-        # Optimized implementations
-        
     ],
     "shortest path": [
         {"key": "dijkstra", "name": "Dijkstra's Algorithm", "func": dijkstra},
-        {"key": "bellman_ford", "name": "Bellman-Ford Algorithm", "func": bellman_ford},
-        {"key": "floyd_warshall", "name": "Floyd-Warshall Algorithm", "func": floyd_warshall},
+        {"key": "bellman_ford", "name": "Bellman-Ford Algorithm", "func": bellman_ford,
+         "tiers": tiers(numpy=bellman_ford_numpy)},
+        {"key": "spfa", "name": "SPFA (Queue-Based Bellman-Ford)", "func": spfa},
+        {"key": "floyd_warshall", "name": "Floyd-Warshall Algorithm", "func": floyd_warshall,
+         "tiers": tiers(numpy=floyd_warshall_numpy)},
+        {"key": "dijkstra_dary", "name": "Dijkstra (Indexed 4-ary Heap)", "func": dijkstra_dary},
+        {"key": "dial_dijkstra", "name": "Dial's Algorithm (Bucket Queue)", "func": dial_dijkstra},
+        {"key": "bidirectional_dijkstra", "name": "Bidirectional Dijkstra", "func": bidirectional_dijkstra},
+        {"key": "astar_landmarks", "name": "A* (Landmarks)", "func": astar_landmarks},
     ],
     "mst": [
         {"key": "prim", "name": "Prim's Algorithm", "func": prim},
@@ -47,6 +100,9 @@ algorithms = {
     "graph": [
         {"key": "bfs", "name": "Breadth-First Search (BFS)", "func": bfs},
         {"key": "dfs", "name": "Depth-First Search (DFS)", "func": dfs},
+        {"key": "bfs_frontier", "name": "Frontier BFS", "func": bfs_frontier,
+         "tiers": tiers(numpy=bfs_numpy)},
+        {"key": "dfs_iterative", "name": "Iterative DFS (Edge Cursor)", "func": dfs_iterative},
     ],
  
      "subset generation": [  
@@ -57,8 +113,82 @@ algorithms = {
         {"key": "subset_builtin", "name": "Python Built-in", "func": subset_builtin, "type": "builtin"},
     ],
     "0/1 knapsack": [
-        {"key": "knapsack_dp", "name": "Dynamic Programming", "func": knapsack_dp, "type": "dp"},
+        {"key": "knapsack_dp", "name": "Dynamic Programming", "func": knapsack_dp, "type": "dp",
+         "tiers": tiers(numpy=knapsack_dp_numpy)},
         {"key": "knapsack_backtracking", "name": "Backtracking", "func": knapsack_backtracking, "type": "backtracking"},
-        {"key": "knapsack_branch_bound", "name": "Branch & Bound", "func": knapsack_branch_bound, "type": "optimization"}
+        {"key": "knapsack_memoized", "name": "Memoized Backtracking", "func": knapsack_memoized, "type": "memoized"},
+        {"key": "knapsack_branch_bound", "name": "Branch & Bound", "func": knapsack_branch_bound, "type": "optimization"},
+        {"key": "knapsack_branch_bound_best_first", "name": "Branch & Bound (Best-First)", "func": knapsack_branch_bound_best_first, "type": "optimization"},
+        # Large-instance engines (see the "large" input profile)
+        {"key": "knapsack_dp_by_value", "name": "DP by Value", "func": knapsack_dp_by_value, "type": "dp"},
+        {"key": "knapsack_pareto", "name": "Pareto Frontier DP", "func": knapsack_pareto, "type": "dp"},
+        {"key": "knapsack_meet_in_middle", "name": "Meet in the Middle", "func": knapsack_meet_in_middle, "type": "optimization"},
     ],
 }
+
+
+class AlgorithmRegistry:
+    """Read-only index over ``algorithms`` built once at import time.
+
+    Lookups by key and by name are O(1) dict hits instead of linear scans,
+    and entries are exposed as read-only mappings so request handlers cannot
+    mutate the shared catalog.
+
+    Every entry carries ``tier`` ("custom") and ``tiers``, the names of the
+    implementation tiers it offers. Each declared tier is also frozen as its
+    own entry with the tier's ``func`` and a suffixed display name, so a
+    battle can pit e.g. ``merge_sort`` against its ``builtin`` tier.
+    """
+
+    def __init__(self, table):
+        self._by_key = {}
+        self._by_name = {}
+        self._by_tier = {}
+        self._entries = {}
+        for category, entries in table.items():
+            frozen = []
+            for entry in entries:
+                declared = entry.get("tiers", {})
+                base = dict(entry, tier="custom",
+                            tiers=tuple(t for t in TIERS if t == "custom" or t in declared))
+                frozen.append(MappingProxyType(base))
+                for tier, func in declared.items():
+                    self._by_tier[(category, entry["key"], tier)] = MappingProxyType(dict(
+                        base, func=func, tier=tier,
+                        name=f"{entry['name']} ({TIER_LABELS[tier]})"))
+            self._entries[category] = tuple(frozen)
+            for entry in self._entries[category]:
+                self._by_key[(category, entry["key"])] = entry
+                self._by_name[(category, entry["name"])] = entry
+        self.categories = tuple(sorted(self._entries))
+
+    def __contains__(self, category):
+        return category in self._entries
+
+    def entries(self, category):
+        """All entries of a category in registration order (empty if unknown)."""
+        return self._entries.get(category, ())
+
+    def find(self, category, key=None, name=None, tier=None):
+        """Look an algorithm up by key first, then by display name.
+
+        With ``tier`` the entry for that implementation tier is returned, or
+        None if the algorithm does not offer it.
+        """
+        entry = None
+        if key is not None:
+            entry = self._by_key.get((category, key))
+        if entry is None and name is not None:
+            entry = self._by_name.get((category, name))
+        if entry is None or tier in (None, "custom"):
+            return entry
+        return self._by_tier.get((category, entry["key"], tier))
+
+    def tier_entries(self, category):
+        """``(entry, tier_entry)`` pairs for every non-custom tier in a category."""
+        return [(entry, self._by_tier[(category, entry["key"], tier)])
+                for entry in self.entries(category)
+                for tier in entry["tiers"] if tier != "custom"]
+
+
+registry = AlgorithmRegistry(algorithms)
@@ -1,10 +1,20 @@
 import heapq
 
+from algorithms.csr import as_csr, relabel_edges
+
+
+def _is_weighted_dict(graph):
+    """True for the ``{u: {v: weight}}`` form the dict code paths expect."""
+    return isinstance(graph, dict) and all(isinstance(adj, dict) for adj in graph.values())
+
+
 def kruskal(graph, start=None):
     """
     Kruskal's algorithm using Python's built-in sort for edge sorting.
     Uses Union-Find data structure for cycle detection.
     """
+    if not _is_weighted_dict(graph):
+        return _kruskal_csr(as_csr(graph))
     parent = {}
     rank = {}
 
@@ -52,6 +62,8 @@ def prim(graph, start):
     Prim's algorithm using Python's heapq module for priority queue.
     Much faster than manual priority queue implementation.
     """
+    if not _is_weighted_dict(graph):
+        return _prim_csr(as_csr(graph), start)
     visited = set([start])
     edges = [(weight, start, neighbor) for neighbor, weight in graph[start].items()]
     heapq.heapify(edges)  # Python's optimized heap construction
@@ -68,3 +80,63 @@ def prim(graph, start):
                 if neighbor not in visited:
                     heapq.heappush(edges, (w, to, neighbor))
     return mst, comparisons
+
+
+# --- CSR code paths (CSRGraph, edge-list or list-of-pairs adjacency input) -----
+
+def _kruskal_csr(graph):
+    """Kruskal over CSR edges with array-based union-find (path halving, union by rank)."""
+    parent = list(range(graph.n))
+    rank = bytearray(graph.n)
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    # Undirected graphs store every edge twice; keep one direction
+    edges = [(w, u, v) for u, v, w in graph.edges() if graph.directed or u < v]
+    edges.sort()  # Python's optimized Timsort algorithm
+
+    mst = []
+    comparisons = 0
+    for weight, u, v in edges:
+        comparisons += 1
+        root_u, root_v = find(u), find(v)
+        if root_u != root_v:
+            if rank[root_u] > rank[root_v]:
+                parent[root_v] = root_u
+            else:
+                parent[root_u] = root_v
+                if rank[root_u] == rank[root_v]:
+                    rank[root_v] += 1
+            mst.append((u, v, weight))
+            if len(mst) == graph.n - 1:
+                break
+
+    return relabel_edges(graph, mst), comparisons
+
+
+def _prim_csr(graph, start=None):
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    source = graph.node_id(start) if start is not None else 0
+    visited = bytearray(graph.n)
+    visited[source] = 1
+    edges = [(1 if weights is None else weights[i], source, targets[i])
+             for i in range(offsets[source], offsets[source + 1])]
+    heapq.heapify(edges)
+    mst = []
+    comparisons = 0
+    while edges:
+        weight, frm, to = heapq.heappop(edges)
+        comparisons += 1
+        if not visited[to]:
+            visited[to] = 1
+            mst.append((frm, to, weight))
+            for i in range(offsets[to], offsets[to + 1]):
+                comparisons += 1
+                neighbor = targets[i]
+                if not visited[neighbor]:
+                    heapq.heappush(edges, (1 if weights is None else weights[i], to, neighbor))
+    return relabel_edges(graph, mst), comparisons
@@ -1,65 +1,760 @@
 import heapq
+from array import array
+from collections import deque
+from collections.abc import Mapping
 
+from algorithms.csr import as_csr, relabel_distances
 
-def dijkstra(graph, start):
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; floyd_warshall_numpy is unavailable without it
+    np = None
+
+
+def _is_weighted_dict(graph):
+    """True for the ``{u: {v: weight}}`` form the dict code paths expect."""
+    return isinstance(graph, dict) and all(isinstance(adj, dict) for adj in graph.values())
+
+
+def dijkstra(graph, start, target=None):
+    """Single-source distances, or ``((distance, settled), comparisons)`` for a ``target``.
+
+    A point-to-point query stops as soon as the target is settled.
+    """
+    if not _is_weighted_dict(graph):
+        return _dijkstra_csr(as_csr(graph), start, target)
     distances = {node: float('inf') for node in graph}
     distances[start] = 0
     pq = [(0, start)]
     comparisons = 0
+    settled = 0
     while pq:
         current_distance, current_node = heapq.heappop(pq)
         if current_distance > distances[current_node]:
             continue
+        settled += 1
+        if current_node == target:
+            break
         for neighbor, weight in graph.get(current_node, {}).items():
             comparisons += 1
             distance = current_distance + weight
             if distance < distances[neighbor]:
                 distances[neighbor] = distance
                 heapq.heappush(pq, (distance, neighbor))
+    if target is not None:
+        return (distances.get(target, float('inf')), settled), comparisons
     return distances, comparisons
 
 
 
-def bellman_ford(graph, start):
-    
+def bellman_ford(graph, start, target=None):
+    """Single-source distances; for a ``target``, ``((distance, settled), comparisons)``.
+
+    Stops after the first pass that changes nothing. Every node counts as
+    settled: no distance is known to be final before the last pass.
+    """
+    if not _is_weighted_dict(graph):
+        return _bellman_ford_csr(as_csr(graph), start, target)
     distances = {node: float('inf') for node in graph}
     distances[start] = 0
     edges = [(u, v, w) for u in graph for v, w in graph[u].items()]
     comparisons = 0
 
     for _ in range(len(graph) - 1):
+        changed = False
+        for u, v, w in edges:
+            comparisons += 1
+            candidate = distances[u] + w
+            if candidate < distances[v]:
+                distances[v] = candidate
+                changed = True
+        if not changed:
+            break  # a pass without updates: distances are final, no negative cycle is reachable
+    else:
+        # Check for negative-weight cycles
         for u, v, w in edges:
             comparisons += 1
             if distances[u] + w < distances[v]:
-                distances[v] = distances[u] + w
-
-    # Check for negative-weight cycles
-    for u, v, w in edges:
-        comparisons += 1
-        if distances[u] + w < distances[v]:
-            raise ValueError("Graph contains a negative-weight cycle")
+                raise ValueError("Graph contains a negative-weight cycle")
 
+    if target is not None:
+        return (distances.get(target, float('inf')), len(distances)), comparisons
     return distances, comparisons
 
 
-def floyd_warshall(graph):
-    # graph: dict {u: {v: weight, ...}, ...}
-    nodes = list(graph.keys())
-    dist = {u: {v: float('inf') for v in nodes} for u in nodes}
+def floyd_warshall(graph, start=None, target=None):
+    """All-pairs shortest paths by the classic triple loop.
+
+    Returns a ``DistanceMatrix`` (read it like the old dict of dicts:
+    ``dist[u][v]``). ``start`` is accepted for the battle call signature;
+    with a ``target`` the result is ``((distance, settled), comparisons)``.
+    Raises ValueError on a negative-weight cycle, like ``floyd_warshall_numpy``.
+    """
+    graph = as_csr(graph)
+    dist, comparisons = _floyd_warshall_csr(graph)
+    if any(dist[i][i] < 0 for i in range(graph.n)):
+        raise ValueError("Graph contains a negative-weight cycle")
+    return _all_pairs_result(DistanceMatrix(dist, graph.labels), start, target, comparisons)
+
+
+# --- CSR code paths (CSRGraph, edge-list or list-of-pairs adjacency input) -----
+# Distances come back as a list indexed by node id, or as {name: distance}
+# when the graph was converted from named nodes.
+
+def _dijkstra_csr(graph, start, target=None):
+    source = graph.node_id(start)
+    goal = None if target is None else graph.node_id(target)
+    distances, settled, comparisons = _dijkstra_ids(graph, source, goal)
+    if goal is not None:
+        return (distances[goal], settled), comparisons
+    return relabel_distances(graph, distances), comparisons
+
+
+def _dijkstra_ids(graph, source, goal=None):
+    """Lazy-deletion ``heapq`` Dijkstra over ids: (distances, settled, comparisons)."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = [float('inf')] * graph.n
+    distances[source] = 0
+    pq = [(0, source)]
+    comparisons = 0
+    settled = 0
+    while pq:
+        current_distance, current_node = heapq.heappop(pq)
+        if current_distance > distances[current_node]:
+            continue
+        settled += 1
+        if current_node == goal:
+            break
+        for i in range(offsets[current_node], offsets[current_node + 1]):
+            comparisons += 1
+            neighbor = targets[i]
+            distance = current_distance + (1 if weights is None else weights[i])
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                heapq.heappush(pq, (distance, neighbor))
+    return distances, settled, comparisons
+
+
+def _bellman_ford_csr(graph, start, target=None):
+    distances = [float('inf')] * graph.n
+    distances[graph.node_id(start)] = 0
+    edges = list(graph.edges())
+    comparisons = 0
+
+    for _ in range(graph.n - 1):
+        changed = False
+        for u, v, w in edges:
+            comparisons += 1
+            candidate = distances[u] + w
+            if candidate < distances[v]:
+                distances[v] = candidate
+                changed = True
+        if not changed:
+            break  # a pass without updates: distances are final, no negative cycle is reachable
+    else:
+        # Check for negative-weight cycles
+        for u, v, w in edges:
+            comparisons += 1
+            if distances[u] + w < distances[v]:
+                raise ValueError("Graph contains a negative-weight cycle")
+
+    if target is not None:
+        return (distances[graph.node_id(target)], graph.n), comparisons
+    return relabel_distances(graph, distances), comparisons
+
+
+def _floyd_warshall_csr(graph):
+    n = graph.n
+    dist = [[float('inf')] * n for _ in range(n)]
     comparisons = 0
 
-    # Initialize distances
-    for u in nodes:
+    # Initialize distances (parallel edges keep the lightest)
+    for u in range(n):
         dist[u][u] = 0
-        for v, w in graph[u].items():
+    for u, v, w in graph.edges():
+        if w < dist[u][v]:
             dist[u][v] = w
 
     # Relax via intermediate nodes
-    for k in nodes:
-        for i in nodes:
-            for j in nodes:
+    for k in range(n):
+        row_k = dist[k]
+        for i in range(n):
+            row_i = dist[i]
+            d_ik = row_i[k]
+            for j in range(n):
                 comparisons += 1
-                if dist[i][k] + dist[k][j] < dist[i][j]:
-                    dist[i][j] = dist[i][k] + dist[k][j]
+                if d_ik + row_k[j] < row_i[j]:
+                    row_i[j] = d_ik + row_k[j]
+
+    return dist, comparisons
+
+
+# --- Point-to-point and specialized engines ------------------------------------
+# All take CSRGraph, edge-list or dict input (converted once by as_csr) and an
+# optional ``target``. Without one they return (distances, comparisons) like
+# dijkstra; with one they stop early and return ((distance, settled),
+# comparisons), where ``settled`` counts nodes whose distance was finalized,
+# the work measure point-to-point engines compete on. Weights must be
+# non-negative.
+
+class IndexedHeap:
+    """d-ary min-heap of node ids 0..n-1 with decrease-key.
+
+    ``pos[node]`` is the node's slot in ``heap`` (-1 when not queued), so a
+    node is queued at most once and an improved distance moves its entry up
+    instead of adding a duplicate.
+    """
+
+    def __init__(self, n, d=4):
+        self.d = d
+        self.heap = []
+        self.keys = [float('inf')] * n
+        self.pos = [-1] * n
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push_or_decrease(self, node, key):
+        """Queue ``node`` with ``key``, or lower its key; returns False if ``key`` is no better."""
+        if key >= self.keys[node]:
+            return False
+        self.keys[node] = key
+        slot = self.pos[node]
+        if slot < 0:
+            slot = len(self.heap)
+            self.heap.append(node)
+        self._sift_up(slot, node, key)
+        return True
+
+    def pop(self):
+        """Remove and return ``(node, key)`` with the smallest key."""
+        heap, pos = self.heap, self.pos
+        top = heap[0]
+        last = heap.pop()
+        pos[top] = -1
+        if heap:
+            self._sift_down(last)
+        return top, self.keys[top]
+
+    def _sift_up(self, slot, node, key):
+        heap, pos, keys, d = self.heap, self.pos, self.keys, self.d
+        while slot:
+            parent = (slot - 1) // d
+            above = heap[parent]
+            if keys[above] <= key:
+                break
+            heap[slot] = above
+            pos[above] = slot
+            slot = parent
+        heap[slot] = node
+        pos[node] = slot
+
+    def _sift_down(self, node):
+        heap, pos, keys, d = self.heap, self.pos, self.keys, self.d
+        size = len(heap)
+        key = keys[node]
+        key_of = keys.__getitem__
+        slot = 0
+        while True:
+            first = slot * d + 1
+            if first >= size:
+                break
+            children = heap[first:first + d]
+            child = min(children, key=key_of)
+            if keys[child] >= key:
+                break
+            best = first + children.index(child)
+            heap[slot] = child
+            pos[child] = slot
+            slot = best
+        heap[slot] = node
+        pos[node] = slot
+
+
+def _point_to_point(graph, distances, goal, settled, comparisons):
+    if goal is not None:
+        return (distances[goal], settled), comparisons
+    return relabel_distances(graph, distances), comparisons
+
+
+def _goal_id(graph, target):
+    return None if target is None else graph.node_id(target)
+
+
+def dijkstra_dary(graph, start, target=None, d=4):
+    """Dijkstra on an ``IndexedHeap`` (4-ary by default): one heap entry per node, true decrease-key."""
+    graph = as_csr(graph)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    goal = _goal_id(graph, target)
+    heap = IndexedHeap(graph.n, d)
+    distances = heap.keys  # a popped node's key is final, so the keys are the distances
+    heap.push_or_decrease(graph.node_id(start), 0)
+    push_or_decrease = heap.push_or_decrease
+    comparisons = 0
+    settled = 0
+    while heap:
+        u, du = heap.pop()
+        settled += 1
+        if u == goal:
+            break
+        lo, hi = offsets[u], offsets[u + 1]
+        comparisons += hi - lo
+        for i in range(lo, hi):
+            v = targets[i]
+            dv = du + (1 if weights is None else weights[i])
+            if dv < distances[v]:  # settled nodes never pass: their key is <= du
+                push_or_decrease(v, dv)
+    return _point_to_point(graph, distances, goal, settled, comparisons)
+
+
+def dial_dijkstra(graph, start, target=None):
+    """Dial's algorithm: Dijkstra with a circular bucket queue for small integer weights.
+
+    With maximum weight C, every queued distance lies within C of the
+    current one, so C + 1 buckets indexed by ``distance % (C + 1)`` replace
+    the heap and each push and pop is O(1).
+    """
+    graph = as_csr(graph)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    if weights is None:
+        max_weight = 1
+    else:
+        if weights.typecode == 'd' and any(w != int(w) for w in weights):
+            raise ValueError("dial_dijkstra requires integer edge weights")
+        max_weight = int(max(weights, default=0))
+        if min(weights, default=0) < 0:
+            raise ValueError("dial_dijkstra requires non-negative edge weights")
+    width = max_weight + 1
+    buckets = [[] for _ in range(width)]
+    goal = _goal_id(graph, target)
+    distances = [float('inf')] * graph.n
+    source = graph.node_id(start)
+    distances[source] = 0
+    buckets[0].append(source)
+    queued = 1
+    current = 0
+    comparisons = 0
+    settled = 0
+    while queued:
+        bucket = buckets[current % width]
+        while bucket:
+            u = bucket.pop()
+            queued -= 1
+            if distances[u] != current:
+                continue  # stale entry: u was improved after this push (or already settled)
+            settled += 1
+            if u == goal:
+                return _point_to_point(graph, distances, goal, settled, comparisons)
+            lo, hi = offsets[u], offsets[u + 1]
+            comparisons += hi - lo
+            for i in range(lo, hi):
+                v = targets[i]
+                dv = current + (1 if weights is None else int(weights[i]))
+                if dv < distances[v]:
+                    distances[v] = dv
+                    buckets[dv % width].append(v)
+                    queued += 1
+        current += 1
+    return _point_to_point(graph, distances, goal, settled, comparisons)
 
+
+def bidirectional_dijkstra(graph, start, target=None):
+    """Dijkstra from the source on the graph and from the target on its reverse.
+
+    The side with the smaller queue minimum advances. ``best`` is the
+    shortest source-target path seen through any scanned edge, and the
+    search stops once the two queue minima sum to at least ``best``. Both
+    sides' settled nodes are counted. Without a target this is plain
+    ``dijkstra``.
+    """
+    graph = as_csr(graph)
+    if target is None:
+        return _dijkstra_csr(graph, start)
+    source, goal = graph.node_id(start), graph.node_id(target)
+    if source == goal:
+        return (0, 1), 0
+    sides = [(graph, [float('inf')] * graph.n, bytearray(graph.n), [(0, source)]),
+             (graph.reverse(), [float('inf')] * graph.n, bytearray(graph.n), [(0, goal)])]
+    sides[0][1][source] = 0
+    sides[1][1][goal] = 0
+    best = float('inf')
+    comparisons = 0
+    settled = 0
+    while sides[0][3] and sides[1][3]:
+        if sides[0][3][0][0] + sides[1][3][0][0] >= best:
+            break
+        side = 0 if sides[0][3][0][0] <= sides[1][3][0][0] else 1
+        g, dist, done, pq = sides[side]
+        other_dist = sides[1 - side][1]
+        du, u = heapq.heappop(pq)
+        if done[u] or du > dist[u]:
+            continue
+        done[u] = 1
+        settled += 1
+        offsets, targets, weights = g.offsets, g.targets, g.weights
+        for i in range(offsets[u], offsets[u + 1]):
+            comparisons += 1
+            v = targets[i]
+            dv = du + (1 if weights is None else weights[i])
+            if dv < dist[v]:
+                dist[v] = dv
+                heapq.heappush(pq, (dv, v))
+            if dv + other_dist[v] < best:
+                best = dv + other_dist[v]
+    return (best, settled), comparisons
+
+
+def landmark_tables(graph, count=4):
+    """Distances to and from ``count`` landmarks for the ALT heuristic.
+
+    Landmarks are picked farthest-first (each is the reachable node farthest
+    from the ones already chosen), starting from the farthest node from id
+    0. Returns a list of ``(from_landmark, to_landmark)`` distance arrays.
+    The tables are stored on the graph (``CSRGraph.landmarks``) and travel
+    with it when it is pickled, so precomputing them once per input (as
+    ``generate_input`` does for point-to-point profiles) covers every
+    battle on that input.
+    """
+    graph = as_csr(graph)
+    return _landmarks(graph, count)[0]
+
+
+def _landmarks(graph, count):
+    """``(tables, settled, comparisons)``; the counts are 0 when the tables were already built."""
+    if graph.landmarks is not None and graph.landmarks[0] == count:
+        return graph.landmarks[1], 0, 0
+    tables = []
+    settled = comparisons = 0
+    if graph.n:
+        reverse = graph.reverse()
+        nearest, settled, comparisons = _dijkstra_ids(graph, 0)
+        for _ in range(min(count, graph.n)):
+            landmark = max(range(graph.n), key=lambda v: nearest[v] if nearest[v] < float('inf') else -1)
+            from_landmark, fwd_settled, fwd_comparisons = _dijkstra_ids(graph, landmark)
+            to_landmark, bwd_settled, bwd_comparisons = _dijkstra_ids(reverse, landmark)
+            settled += fwd_settled + bwd_settled
+            comparisons += fwd_comparisons + bwd_comparisons
+            tables.append((array('d', from_landmark), array('d', to_landmark)))
+            nearest = [min(a, b) for a, b in zip(nearest, from_landmark)] if tables[1:] else from_landmark
+    graph.landmarks = (count, tables)
+    return tables, settled, comparisons
+
+
+def astar_landmarks(graph, start, target=None, landmarks=4):
+    """A* with the ALT (landmark + triangle inequality) heuristic.
+
+    Generated graphs carry no coordinates, so the lower bound on d(v, t)
+    comes from landmark distances: d(L, t) - d(L, v) and d(v, L) - d(t, L).
+    It is admissible and consistent for non-negative weights, so each node
+    is settled once. The landmark tables come with the graph when they were
+    precomputed (see ``landmark_tables``); otherwise this call builds them,
+    and the nodes settled and edges scanned by those Dijkstra runs are
+    included in the reported counts. Without a target this is plain
+    ``dijkstra``.
+    """
+    graph = as_csr(graph)
+    if target is None:
+        return _dijkstra_csr(graph, start)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    source, goal = graph.node_id(start), graph.node_id(target)
+    inf = float('inf')
+    tables, settled, comparisons = _landmarks(graph, landmarks)
+    bounds = [(fwd[goal], bwd[goal], fwd, bwd) for fwd, bwd in tables]
+    estimate = {}
+
+    def h(v):
+        value = estimate.get(v)
+        if value is None:
+            value = 0
+            for fwd_goal, bwd_goal, fwd, bwd in bounds:
+                if fwd_goal < inf and fwd[v] < inf and fwd_goal - fwd[v] > value:
+                    value = fwd_goal - fwd[v]
+                if bwd[v] < inf and bwd_goal < inf and bwd[v] - bwd_goal > value:
+                    value = bwd[v] - bwd_goal
+            estimate[v] = value
+        return value
+
+    distances = [inf] * graph.n
+    distances[source] = 0
+    done = bytearray(graph.n)
+    pq = [(h(source), source)]
+    while pq:
+        _, u = heapq.heappop(pq)
+        if done[u]:
+            continue
+        done[u] = 1
+        settled += 1
+        if u == goal:
+            break
+        du = distances[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            comparisons += 1
+            v = targets[i]
+            dv = du + (1 if weights is None else weights[i])
+            if dv < distances[v]:
+                distances[v] = dv
+                heapq.heappush(pq, (dv + h(v), v))
+    return (distances[goal], settled), comparisons
+
+
+# --- Negative weights ----------------------------------------------------------
+# Same target/return conventions as above; negative edge weights are allowed
+# and a negative-weight cycle reachable from the start raises ValueError.
+
+def spfa(graph, start, target=None):
+    """Shortest Path Faster Algorithm: Bellman-Ford driven by a FIFO of changed nodes.
+
+    Only nodes whose distance dropped get their edges rescanned, and an
+    in-queue bitmap keeps each node in the queue at most once. ``hops[v]``
+    counts the relaxations along v's current path; reaching n means the
+    path repeats a node, which only a negative cycle can cause.
+    Comparisons count edge relaxations.
+    """
+    graph = as_csr(graph)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = graph.n
+    goal = _goal_id(graph, target)
+    distances = [float('inf')] * n
+    hops = [0] * n
+    in_queue = bytearray(n)
+    source = graph.node_id(start)
+    distances[source] = 0
+    in_queue[source] = 1
+    queue = deque([source])
+    comparisons = 0
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = 0
+        du = distances[u]
+        lo, hi = offsets[u], offsets[u + 1]
+        comparisons += hi - lo
+        for i in range(lo, hi):
+            v = targets[i]
+            dv = du + (1 if weights is None else weights[i])
+            if dv < distances[v]:
+                distances[v] = dv
+                hops[v] = hops[u] + 1
+                if hops[v] >= n:
+                    raise ValueError("Graph contains a negative-weight cycle")
+                if not in_queue[v]:
+                    in_queue[v] = 1
+                    queue.append(v)
+    return _point_to_point(graph, distances, goal, n, comparisons)
+
+
+def bellman_ford_numpy(graph, start, target=None):
+    """Bellman-Ford with every pass relaxing all edges at once in NumPy.
+
+    A pass gathers ``dist[sources] + weights`` over the CSR edge arrays and
+    scatters the minimum per target with ``np.minimum.at``. All edges read
+    the previous pass's distances, which keeps the n - 1 pass bound, and
+    like ``bellman_ford`` it stops after a pass without improvement.
+    Comparisons count edge relaxations (m per pass).
+    """
+    if np is None:
+        raise ImportError("bellman_ford_numpy requires NumPy")
+    graph = as_csr(graph)
+    n = graph.n
+    offsets, targets, weights = graph.to_numpy()
+    sources = np.repeat(np.arange(n), np.diff(offsets))
+    weights = np.ones(len(targets)) if weights is None else weights.astype(np.float64)
+    dist = np.full(n, np.inf)
+    dist[graph.node_id(start)] = 0.0
+    comparisons = 0
+    for _ in range(n - 1):
+        updated = dist.copy()
+        np.minimum.at(updated, targets, dist[sources] + weights)
+        comparisons += len(targets)
+        if np.array_equal(updated, dist):
+            break
+        dist = updated
+    else:
+        comparisons += len(targets)
+        if np.any(dist[sources] + weights < dist[targets]):
+            raise ValueError("Graph contains a negative-weight cycle")
+    return _point_to_point(graph, dist.tolist(), _goal_id(graph, target), n, comparisons)
+
+
+# --- All-pairs results and the vectorized engine ---------------------------------
+
+class DistanceMatrix(Mapping):
+    """All-pairs distances kept as one dense matrix, indexed by node names.
+
+    ``matrix`` is a list of row lists or a 2-D NumPy array in node-id order.
+    As a read-only mapping it behaves like the nested ``{u: {v: distance}}``
+    dict ``floyd_warshall`` used to return (``dist[u][v]``, ``dist[u].items()``,
+    ``dist.to_dict()``), but rows are views, not per-entry dicts.
+    ``predecessors[i][j]`` is the id before ``j`` on a shortest ``i -> j``
+    path (-1 for none), when the engine recorded it.
+    """
+
+    def __init__(self, matrix, labels=None, predecessors=None):
+        self.matrix = matrix
+        self.labels = labels
+        self.predecessors = predecessors
+        self._ids = None if labels is None else {name: i for i, name in enumerate(labels)}
+
+    def _id(self, node):
+        return node if self._ids is None else self._ids[node]
+
+    def __getitem__(self, node):
+        try:
+            return _MatrixRow(self.matrix[self._id(node)], self.labels, self._ids)
+        except (IndexError, TypeError):
+            raise KeyError(node) from None
+
+    def __iter__(self):
+        return iter(range(len(self.matrix)) if self.labels is None else self.labels)
+
+    def __len__(self):
+        return len(self.matrix)
+
+    def distance(self, u, v):
+        return _scalar(self.matrix[self._id(u)][self._id(v)])
+
+    def path(self, u, v):
+        """Node names along a shortest ``u -> v`` path ([] if unreachable)."""
+        if self.predecessors is None:
+            raise ValueError("distance matrix was computed without predecessors")
+        i, j = self._id(u), self._id(v)
+        if i != j and self.predecessors[i][j] < 0:
+            return []
+        path = [j]
+        while j != i:
+            j = int(self.predecessors[i][j])
+            path.append(j)
+        path.reverse()
+        return path if self.labels is None else [self.labels[k] for k in path]
+
+    def to_dict(self):
+        return {u: dict(row.items()) for u, row in self.items()}
+
+    def __repr__(self):
+        kind = "ndarray" if np is not None and isinstance(self.matrix, np.ndarray) else "lists"
+        extra = ", predecessors" if self.predecessors is not None else ""
+        return f"DistanceMatrix(n={len(self.matrix)}, {kind}{extra})"
+
+
+class _MatrixRow(Mapping):
+    """One row of a DistanceMatrix, read by target node name."""
+
+    def __init__(self, row, labels, ids):
+        self.row = row
+        self.labels = labels
+        self.ids = ids
+
+    def __getitem__(self, node):
+        try:
+            return _scalar(self.row[node if self.ids is None else self.ids[node]])
+        except (IndexError, TypeError):
+            raise KeyError(node) from None
+
+    def __iter__(self):
+        return iter(range(len(self.row)) if self.labels is None else self.labels)
+
+    def __len__(self):
+        return len(self.row)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+def _scalar(value):
+    """Plain Python number for a NumPy matrix entry."""
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _all_pairs_result(dist, start, target, comparisons):
+    if target is not None:
+        return (dist.distance(start, target), len(dist)), comparisons
     return dist, comparisons
+
+
+def floyd_warshall_numpy(graph, start=None, target=None, block_size=None, predecessors=False):
+    """Floyd-Warshall on a contiguous float64 matrix, one broadcast update per k.
+
+    Each step is ``D = min(D, D[:, k, None] + D[None, k, :])`` written into
+    a preallocated buffer. With ``block_size`` the k loop runs a block of
+    pivots at a time: first the pivot rows and columns, then every
+    ``block_size`` square tile for the whole block while it is in cache.
+    ``predecessors=True`` also tracks a predecessor matrix for
+    ``DistanceMatrix.path``; it always uses the plain pivot order, because
+    blocked updates read panels already past a pivot and, with zero-weight
+    cycles, predecessor chains could then loop. Comparisons count the n^3
+    logical relaxations.
+    Raises ValueError on a negative-weight cycle.
+    """
+    if np is None:
+        raise ImportError("floyd_warshall_numpy requires NumPy")
+    graph = as_csr(graph)
+    n = graph.n
+    offsets, targets, weights = graph.to_numpy()
+    sources = np.repeat(np.arange(n), np.diff(offsets))
+    dist = np.full((n, n), np.inf)
+    np.fill_diagonal(dist, 0.0)
+    # Parallel edges keep the lightest
+    np.minimum.at(dist, (sources, targets), 1.0 if weights is None else weights)
+    pred = None
+    if predecessors:
+        pred = np.where(np.isfinite(dist), np.arange(n)[:, None], -1)
+        np.fill_diagonal(pred, -1)
+    if block_size and pred is None:
+        _floyd_warshall_blocked(dist, block_size)
+    else:
+        buffer = np.empty_like(dist)
+        mask = np.empty((n, n), dtype=bool) if pred is not None else None
+        for k in range(n):
+            _relax_pivot(dist, pred, k, dist[:, k, None], dist[k], buffer, mask)
+    if n and np.diagonal(dist).min() < 0:
+        raise ValueError("Graph contains a negative-weight cycle")
+    return _all_pairs_result(DistanceMatrix(dist, graph.labels, pred), start, target, n ** 3)
+
+
+def _relax_pivot(dist, pred, k, column, row, buffer, mask):
+    """``dist = min(dist, column + row)`` in place through ``buffer``; ``pred`` follows pivot ``k``."""
+    np.add(column, row, out=buffer)
+    if pred is None:
+        np.minimum(dist, buffer, out=dist)
+        return
+    np.less(buffer, dist, out=mask)
+    np.copyto(dist, buffer, where=mask)
+    np.copyto(pred, pred[k].copy(), where=mask)
+
+
+def _floyd_warshall_blocked(dist, b):
+    """Blocked Floyd-Warshall over ``b x b`` tiles, in place.
+
+    Per block of pivots: the pivot rows (full width), then the pivot
+    columns (full height), then the remaining tiles against those panels.
+    Distances only decrease and stay real path lengths, so reading panels
+    that are already past a pivot is safe.
+    """
+    n = len(dist)
+    buffer = np.empty((b, n))
+    for k0 in range(0, n, b):
+        k1 = min(k0 + b, n)
+        pivots = slice(k0, k1)
+        height = k1 - k0
+        panel = dist[pivots]
+        for k in range(k0, k1):
+            _relax_pivot(panel, None, None, panel[:, k, None], dist[k], buffer[:height], None)
+        for i0 in range(0, n, b):
+            if i0 == k0:
+                continue
+            i1 = min(i0 + b, n)
+            panel = dist[i0:i1, pivots]
+            for k in range(k0, k1):
+                _relax_pivot(panel, None, None, panel[:, k - k0, None], dist[k, pivots],
+                             buffer[:i1 - i0, :height], None)
+        for i0 in range(0, n, b):
+            if i0 == k0:
+                continue
+            i1 = min(i0 + b, n)
+            for j0 in range(0, n, b):
+                if j0 == k0:
+                    continue
+                j1 = min(j0 + b, n)
+                tile = dist[i0:i1, j0:j1]
+                tile_buffer = buffer[:i1 - i0, :j1 - j0]
+                for k in range(k0, k1):
+                    _relax_pivot(tile, None, None, dist[i0:i1, k, None], dist[k, j0:j1], tile_buffer, None)
@@ -110,6 +110,192 @@ def heap_sort(arr):
         comps += 1
     return result, comps
 
+# In-place engines: one copy of the input, no per-level allocation
+
+INSERTION_CUTOFF = 16
+
+
+def _insertion_sort_range(a, lo, hi):
+    """Insertion sort of a[lo..hi] in place; returns comparisons."""
+    comps = 0
+    for i in range(lo + 1, hi + 1):
+        key = a[i]
+        j = i - 1
+        while j >= lo:
+            comps += 1
+            if a[j] > key:
+                a[j + 1] = a[j]
+                j -= 1
+            else:
+                break
+        a[j + 1] = key
+    return comps
+
+
+def _sift_down(a, lo, root, end):
+    """Restore the max-heap property below ``root`` for the heap a[lo..end]."""
+    comps = 0
+    item = a[root]
+    while True:
+        child = 2 * (root - lo) + 1 + lo
+        if child > end:
+            break
+        if child < end:
+            comps += 1
+            if a[child + 1] > a[child]:
+                child += 1
+        comps += 1
+        if a[child] > item:
+            a[root] = a[child]
+            root = child
+        else:
+            break
+    a[root] = item
+    return comps
+
+
+def _heapsort_range(a, lo, hi):
+    """Heapsort of a[lo..hi] in place; returns comparisons."""
+    comps = 0
+    n = hi - lo + 1
+    for root in range(lo + n // 2 - 1, lo - 1, -1):
+        comps += _sift_down(a, lo, root, hi)
+    for end in range(hi, lo, -1):
+        a[lo], a[end] = a[end], a[lo]
+        comps += _sift_down(a, lo, lo, end - 1)
+    return comps
+
+
+def heap_sort_inplace(arr):
+    """True heapsort: bottom-up heapify plus sift-down extraction, in place.
+    Counts every element comparison made while sifting.
+    """
+    a = arr.copy()
+    comps = _heapsort_range(a, 0, len(a) - 1) if a else 0
+    return a, comps
+
+
+def merge_sort_bottom_up(arr):
+    """Bottom-up (iterative) merge sort with one preallocated buffer.
+    Runs of width 1, 2, 4, ... are merged back and forth between the list and
+    a single auxiliary buffer, so no slices are created at any level.
+    """
+    a = arr.copy()
+    n = len(a)
+    src, dst = a, [None] * n
+    comps = 0
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                comps += 1
+                if src[i] <= src[j]:
+                    dst[k] = src[i]
+                    i += 1
+                else:
+                    dst[k] = src[j]
+                    j += 1
+                k += 1
+            while i < mid:
+                dst[k] = src[i]
+                i += 1
+                k += 1
+            while j < hi:
+                dst[k] = src[j]
+                j += 1
+                k += 1
+        src, dst = dst, src
+        width *= 2
+    return src, comps
+
+
+def introsort(arr):
+    """Introsort: quicksort with median-of-three pivots and 3-way partitioning,
+    insertion sort below a small cutoff and a heapsort fallback once the
+    recursion depth exceeds 2*log2(n), so the worst case stays O(n log n).
+    Runs in place on one copy, driven by an explicit stack.
+    """
+    a = arr.copy()
+    n = len(a)
+    comps = 0
+    stack = [(0, n - 1, 2 * max(n, 1).bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo + 1 > INSERTION_CUTOFF:
+            if depth == 0:
+                comps += _heapsort_range(a, lo, hi)
+                break
+            depth -= 1
+
+            # Median of three (first, middle, last) as the pivot value
+            mid = (lo + hi) // 2
+            x, y, z = a[lo], a[mid], a[hi]
+            comps += 2
+            if x < y:
+                if y < z:
+                    pivot = y
+                else:
+                    comps += 1
+                    pivot = z if x < z else x
+            else:
+                if x < z:
+                    pivot = x
+                else:
+                    comps += 1
+                    pivot = z if y < z else y
+
+            # Bentley-McIlroy 3-way partition: equal keys are parked at both
+            # ends while scanning, then swapped into the middle. Unlike a
+            # single-pass Dijkstra partition it leaves sorted runs intact.
+            p_lo, i, j, p_hi = lo, lo, hi, hi
+            while True:
+                while i <= j:
+                    comps += 1
+                    if a[i] > pivot:
+                        break
+                    comps += 1
+                    if a[i] == pivot:
+                        a[p_lo], a[i] = a[i], a[p_lo]
+                        p_lo += 1
+                    i += 1
+                while j >= i:
+                    comps += 1
+                    if a[j] < pivot:
+                        break
+                    comps += 1
+                    if a[j] == pivot:
+                        a[j], a[p_hi] = a[p_hi], a[j]
+                        p_hi -= 1
+                    j -= 1
+                if i > j:
+                    break
+                a[i], a[j] = a[j], a[i]
+                i += 1
+                j -= 1
+            # Swap the parked equal keys into the middle
+            count = min(p_lo - lo, i - p_lo)
+            for k in range(count):
+                a[lo + k], a[i - count + k] = a[i - count + k], a[lo + k]
+            count = min(p_hi - j, hi - p_hi)
+            for k in range(count):
+                a[i + k], a[hi - count + 1 + k] = a[hi - count + 1 + k], a[i + k]
+            lt = lo + (i - p_lo)       # first index of the == pivot block
+            gt = hi - (p_hi - j)       # last index of the == pivot block
+
+            # Defer the larger side, keep working on the smaller one
+            if lt - lo < hi - gt:
+                stack.append((gt + 1, hi, depth))
+                hi = lt - 1
+            else:
+                stack.append((lo, lt - 1, depth))
+                lo = gt + 1
+        else:
+            comps += _insertion_sort_range(a, lo, hi)
+    return a, comps
+
 # Alternative: Using heapq for actual heap sort implementation
 import heapq
 
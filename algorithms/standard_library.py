@@ -0,0 +1,142 @@
+"""
+Built-in and NumPy implementation tiers for the custom algorithms.
+
+Each function keeps the ``(result, comparisons)`` contract of the custom
+versions so it can be battled, validated and benchmarked the same way. The
+comparisons happen inside C loops that cannot be instrumented, so only
+Python-level checks are counted (usually 0): the interesting number for these tiers is the time gap to
+the pure-Python implementation of the same algorithm.
+"""
+import heapq
+import re
+
+from algorithms.searching import _is_batch, indexed_search, prepare_index
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the numpy tier is skipped without it
+    np = None
+
+
+def _require_numpy(name):
+    if np is None:
+        raise ImportError(f"{name} requires NumPy")
+
+
+# --- Sorting -------------------------------------------------------------------
+
+def python_builtin_sort(arr):
+    """``sorted`` (Timsort, a run-adaptive merge sort)."""
+    return sorted(arr), 0
+
+
+def heapq_sort(arr):
+    """``heapq.nsmallest`` over the whole input: heapify plus n pops in C."""
+    return heapq.nsmallest(len(arr), arr), 0
+
+
+def numpy_sort(arr):
+    """``np.sort`` with the default kind (introsort)."""
+    _require_numpy("numpy_sort")
+    return np.sort(np.asarray(arr)).tolist(), 0
+
+
+def numpy_sort_stable(arr):
+    """``np.sort(kind='stable')`` (radix sort for small ints, else Timsort)."""
+    _require_numpy("numpy_sort_stable")
+    return np.sort(np.asarray(arr), kind='stable').tolist(), 0
+
+
+def numpy_heap_sort(arr):
+    """``np.sort(kind='heapsort')``."""
+    _require_numpy("numpy_heap_sort")
+    return np.sort(np.asarray(arr), kind='heapsort').tolist(), 0
+
+
+# --- Searching -----------------------------------------------------------------
+# Targets may be a single value or a batch (list), like the custom searches.
+
+def builtin_linear_search(arr, target):
+    """``list.index``: a linear scan in C. Returns (index_or_-1, comparisons)."""
+    if _is_batch(target):
+        return [_list_index(arr, t) for t in target], 0
+    return _list_index(arr, target), 0
+
+
+def _list_index(arr, target):
+    try:
+        return arr.index(target)
+    except ValueError:
+        return -1
+
+
+def bisect_search(arr, target):
+    """``bisect_left`` over the cached sorted index, like ``binary_search``.
+
+    Returns (index_or_-1, comparisons)
+    """
+    return indexed_search(arr, target, "bisect")
+
+
+def numpy_linear_search(arr, target):
+    """Vectorized equality scan with ``np.flatnonzero``."""
+    _require_numpy("numpy_linear_search")
+    a = np.asarray(arr)
+    if _is_batch(target):
+        return [_first_hit(a, t) for t in target], 0
+    return _first_hit(a, target), 0
+
+
+def _first_hit(a, target):
+    hits = np.flatnonzero(a == target)
+    return int(hits[0]) if hits.size else -1
+
+
+def numpy_binary_search(arr, target):
+    """``np.searchsorted`` over the cached sorted index, like ``binary_search``.
+
+    A batch is answered by a single vectorized call.
+    """
+    _require_numpy("numpy_binary_search")
+    return indexed_search(arr, target, "numpy")
+
+
+bisect_search.prepare = numpy_binary_search.prepare = prepare_index
+
+
+# --- String matching -------------------------------------------------------------
+
+def str_find_search(text, pattern):
+    """Repeated ``str.find`` (CPython's two-way/Horspool fastsearch).
+
+    Overlapping matches are found by restarting one past each hit. Works on
+    ``bytes`` too; a ``memoryview`` has no ``find`` and is copied to bytes.
+    Returns (matches_list, comparisons)
+    """
+    if not pattern:
+        return list(range(len(text) + 1)), 0
+    if isinstance(text, memoryview):
+        text = text.tobytes()
+    matches = []
+    i = text.find(pattern)
+    while i != -1:
+        matches.append(i)
+        i = text.find(pattern, i + 1)
+    return matches, 0
+
+
+def regex_search(text, pattern):
+    """``re.finditer`` with a lookahead so overlapping matches are reported.
+
+    The regex engine tries the pattern at every position with backtracking,
+    which makes it the C counterpart of ``naive_search``.
+    Returns (matches_list, comparisons)
+    """
+    if not pattern:
+        return list(range(len(text) + 1)), 0
+    if isinstance(pattern, str):
+        finder = re.compile(f"(?={re.escape(pattern)})")
+    else:
+        # bytes-like text (including a memoryview) is scanned in place
+        finder = re.compile(b"(?=" + re.escape(bytes(pattern)) + b")")
+    return [m.start() for m in finder.finditer(text)], 0
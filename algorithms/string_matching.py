@@ -1,4 +1,12 @@
 # algorithms/string_matching.py
+#
+# The single-pattern matchers accept ``str`` or bytes-like text (``bytes``,
+# ``bytearray``, ``memoryview`` over an mmap). They only index into it, so a
+# memoryview chunk is scanned without copying; the pattern must be of the
+# same kind as the text.
+from functools import lru_cache
+from itertools import chain, islice
+
 
 def naive_search(text, pattern):
     """Naive pattern matching with character-comparison counting.
@@ -75,6 +83,8 @@ def rabin_karp(text, pattern, prime=101):
     matches = []
     n, m = len(text), len(pattern)
     d = 256  # alphabet size
+    # str characters need ord(); bytes-like text already indexes to ints
+    code = ord if isinstance(text, str) else int
 
     comparisons = 0
     if m > n:
@@ -89,8 +99,8 @@ def rabin_karp(text, pattern, prime=101):
         h = (h * d) % prime
 
     for i in range(m):
-        p_hash = (d * p_hash + ord(pattern[i])) % prime
-        t_hash = (d * t_hash + ord(text[i])) % prime
+        p_hash = (d * p_hash + code(pattern[i])) % prime
+        t_hash = (d * t_hash + code(text[i])) % prime
 
     for i in range(n - m + 1):
         if p_hash == t_hash:
@@ -104,44 +114,530 @@ def rabin_karp(text, pattern, prime=101):
             if match:
                 matches.append(i)
         if i < n - m:
-            t_hash = (d * (t_hash - ord(text[i]) * h) + ord(text[i+m])) % prime
+            t_hash = (d * (t_hash - code(text[i]) * h) + code(text[i+m])) % prime
             if t_hash < 0:
                 t_hash += prime
     return matches, comparisons
 
 
-def boyer_moore(text, pattern):
+# Rolling hash modulo the Mersenne prime 2**61 - 1: a window collides with an
+# unrelated pattern with probability about m / 2**61 instead of 1 / 101.
+RK_MODULUS = (1 << 61) - 1
+RK_BASE = 911382323
+_rk_powers = [1]  # RK_BASE**k % RK_MODULUS, grown on demand and shared
+
+
+def _rk_power(k):
+    """``RK_BASE**k mod RK_MODULUS`` from the precomputed power table."""
+    powers = _rk_powers
+    while len(powers) <= k:
+        powers.append(powers[-1] * RK_BASE % RK_MODULUS)
+    return powers[k]
+
+
+def _char_codes(text):
+    """Character codes of ``text``; bytes-like text is returned as is (no copy)."""
+    if isinstance(text, str):
+        try:
+            return text.encode('latin-1')
+        except UnicodeEncodeError:
+            return list(map(ord, text))
+    return text
+
+
+def _rk_hash(codes):
+    h = 0
+    for c in codes:
+        h = (h * RK_BASE + c) % RK_MODULUS
+    return h
+
+
+def _rk_verify(text, i, pattern):
+    """Character-by-character check of a hash hit; returns (matched, comparisons)."""
+    m = len(pattern)
+    j = 0
+    while j < m:
+        if text[i + j] != pattern[j]:
+            return False, j + 1
+        j += 1
+    return True, m
+
+
+def rabin_karp_64(text, pattern):
     """
-    Boyer-Moore algorithm with bad character heuristic.
-    No built-in equivalent - manual implementation for educational purposes.
+    Rabin-Karp with a 61-bit Mersenne-prime modulus and a precomputed power table.
+    Every hash hit is verified; hits that fail verification are spurious.
+
+    Returns ((matches_list, spurious_hits), comparisons)
     """
-    def bad_char_table(pattern):
-        table = {}
-        length = len(pattern)
-        for i in range(length - 1):
-            table[pattern[i]] = length - i - 1
-        return table
+    n, m = len(text), len(pattern)
+    if m == 0:
+        return (list(range(n + 1)), 0), 0
+    if m > n:
+        return ([], 0), 0
+    mod, base = RK_MODULUS, RK_BASE
+    top = _rk_power(m - 1)
+    codes = _char_codes(text)
+    p_hash = _rk_hash(_char_codes(pattern))
+    t_hash = _rk_hash(islice(codes, m))
 
     matches = []
+    comparisons = spurious = 0
+    i = 0
+    # Window i is checked, then rolled to i + 1 by dropping `out` and adding `inn`
+    for out, inn in chain(zip(codes, islice(codes, m, None)), ((0, 0),)):
+        if t_hash == p_hash:
+            matched, count = _rk_verify(text, i, pattern)
+            comparisons += count
+            if matched:
+                matches.append(i)
+            else:
+                spurious += 1
+        t_hash = ((t_hash - out * top) * base + inn) % mod
+        i += 1
+    return (matches, spurious), comparisons
+
+
+def rabin_karp_multi(text, patterns):
+    """
+    Multi-pattern Rabin-Karp: one rolling-hash pass per distinct pattern length,
+    each window hash looked up in a hash table of the patterns of that length.
+    Equal-length pattern sets take a single pass over the text.
+
+    Returns ((matches_per_pattern, spurious_hits), comparisons)
+    """
+    n = len(text)
+    mod, base = RK_MODULUS, RK_BASE
+    codes = _char_codes(text)
+    matches = {p: [] for p in patterns}
+    comparisons = spurious = 0
+
+    by_length = {}
+    for pattern in matches:
+        by_length.setdefault(len(pattern), []).append(pattern)
+    for m, group in by_length.items():
+        if m == 0:
+            matches[group[0]] = list(range(n + 1))
+            continue
+        if m > n:
+            continue
+        table = {}
+        for pattern in group:
+            table.setdefault(_rk_hash(_char_codes(pattern)), []).append(pattern)
+        top = _rk_power(m - 1)
+        t_hash = _rk_hash(islice(codes, m))
+        i = 0
+        for out, inn in chain(zip(codes, islice(codes, m, None)), ((0, 0),)):
+            candidates = table.get(t_hash)
+            if candidates is not None:
+                hit = False
+                for pattern in candidates:
+                    matched, count = _rk_verify(text, i, pattern)
+                    comparisons += count
+                    if matched:
+                        matches[pattern].append(i)
+                        hit = True
+                if not hit:
+                    spurious += 1
+            t_hash = ((t_hash - out * top) * base + inn) % mod
+            i += 1
+    return (matches, spurious), comparisons
+
+# --- Shift-table matchers ------------------------------------------------------
+# Boyer-Moore, Horspool and Sunday index 256-entry shift tables by character
+# code. Codes above 255 share a bucket (code & 0xFF); each bucket keeps the
+# most conservative shift of its characters, so shifts stay safe for any
+# text. Tables depend only on the pattern and are cached between calls.
+
+def _pattern_key(pattern):
+    """Hashable character codes of a pattern (bytes when they fit)."""
+    codes = _char_codes(pattern)
+    return bytes(codes) if not isinstance(codes, list) else tuple(codes)
+
+
+class _CharTable(dict):
+    """A 256-entry shift table keyed by str character instead of code.
+
+    Every latin-1 character has an entry; any other character falls back to
+    the bucket of ``ord(ch) & 0xFF`` like the code-indexed table.
+    """
+
+    def __init__(self, table):
+        super().__init__(zip(map(chr, range(256)), table))
+        self.table = table
+
+    def __missing__(self, ch):
+        return self.table[ord(ch) & 0xFF]
+
+
+@lru_cache(maxsize=128)
+def _char_tables(builder, key):
+    """``builder(key)``'s table keyed by character: as a plain dict (faster to
+    index, enough for ASCII text) and as a ``_CharTable``."""
+    table = _CharTable(builder(key))
+    return dict(table), table
+
+
+def _scan_view(text, pattern, key, builder):
+    """``(p, table)`` for a shift-table scan of ``text``: the pattern to compare
+    against text items and ``builder(key)``'s table, indexed by a text item.
+
+    A str text is not encoded, since that O(n) copy would come before a
+    sublinear scan: it is compared to the str pattern directly and the table
+    is keyed by character (``str.isascii`` is O(1)). Bytes-like items are
+    codes below 256 already.
+    """
+    if isinstance(text, str):
+        ascii_table, table = _char_tables(builder, key)
+        return pattern, ascii_table if text.isascii() else table
+    return key, builder(key)
+
+
+@lru_cache(maxsize=128)
+def _boyer_moore_tables(key):
+    """Bad-character last occurrences and strong good-suffix shifts."""
+    m = len(key)
+    last = [-1] * 256
+    for j, c in enumerate(key):
+        last[c & 0xFF] = j
+
+    # good_suffix[j]: shift when key[j:] matched and key[j-1] mismatched;
+    # good_suffix[0] is the period used after a full match
+    good_suffix = [0] * (m + 1)
+    border = [0] * (m + 1)
+    i, j = m, m + 1
+    border[i] = j
+    while i > 0:
+        while j <= m and key[i - 1] != key[j - 1]:
+            if good_suffix[j] == 0:
+                good_suffix[j] = j - i
+            j = border[j]
+        i -= 1
+        j -= 1
+        border[i] = j
+    j = border[0]
+    for i in range(m + 1):
+        if good_suffix[i] == 0:
+            good_suffix[i] = j
+        if i == j:
+            j = border[j]
+    return last, good_suffix
+
+
+def _bad_character_table(key):
+    return _boyer_moore_tables(key)[0]
+
+
+@lru_cache(maxsize=128)
+def _horspool_table(key):
+    m = len(key)
+    shift = [m] * 256
+    for j in range(m - 1):
+        shift[key[j] & 0xFF] = m - 1 - j
+    return shift
+
+
+@lru_cache(maxsize=128)
+def _sunday_table(key):
+    m = len(key)
+    shift = [m + 1] * 256
+    for j in range(m):
+        shift[key[j] & 0xFF] = m - j
+    return shift
+
+
+def boyer_moore(text, pattern):
+    """
+    Boyer-Moore with the bad-character and strong good-suffix rules plus
+    Galil's rule: after a match, the prefix already known to match (all but
+    one period of the pattern) is not compared again, which makes the scan
+    O(n + m) in the worst case and sublinear on typical text.
+
+    Returns (matches_list, comparisons)
+    """
     n, m = len(text), len(pattern)
+    if m == 0:
+        return list(range(n + 1)), 0
+    if m > n:
+        return [], 0
+    key = _pattern_key(pattern)
+    good_suffix = _boyer_moore_tables(key)[1]
+    p, last = _scan_view(text, pattern, key, _bad_character_table)
+    period = good_suffix[0]
+
+    matches = []
     comparisons = 0
-    if m == 0 or n < m:
-        return matches, comparisons
+    s = 0
+    known = 0  # pattern[:known] is known to match at this alignment (Galil)
+    while s <= n - m:
+        j = m - 1
+        while j >= known:
+            comparisons += 1
+            if p[j] != text[s + j]:
+                break
+            j -= 1
+        if j < known:
+            matches.append(s)
+            s += period
+            known = m - period
+        else:
+            bad_char = j - last[text[s + j]]
+            s += max(good_suffix[j + 1], bad_char)
+            known = 0
+    return matches, comparisons
 
-    bad_char = bad_char_table(pattern)
-    i = 0
-    while i <= n - m:
+
+def horspool(text, pattern):
+    """
+    Boyer-Moore-Horspool: compare right to left, then shift by the
+    bad-character distance of the window's last character.
+
+    Returns (matches_list, comparisons)
+    """
+    n, m = len(text), len(pattern)
+    if m == 0:
+        return list(range(n + 1)), 0
+    if m > n:
+        return [], 0
+    key = _pattern_key(pattern)
+    p, shift = _scan_view(text, pattern, key, _horspool_table)
+
+    matches = []
+    comparisons = 0
+    s = 0
+    while s <= n - m:
         j = m - 1
         while j >= 0:
             comparisons += 1
-            if pattern[j] == text[i + j]:
-                j -= 1
-            else:
+            if p[j] != text[s + j]:
                 break
+            j -= 1
         if j < 0:
-            matches.append(i)
-            i += m
-        else:
-            shift = bad_char.get(text[i + m - 1], m)
-            i += shift
+            matches.append(s)
+        s += shift[text[s + m - 1]]
+    return matches, comparisons
+
+
+def sunday(text, pattern):
+    """
+    Sunday's Quick Search: compare left to right, then shift by the position
+    of the character just past the window, so shifts reach m + 1.
+
+    Returns (matches_list, comparisons)
+    """
+    n, m = len(text), len(pattern)
+    if m == 0:
+        return list(range(n + 1)), 0
+    if m > n:
+        return [], 0
+    key = _pattern_key(pattern)
+    p, shift = _scan_view(text, pattern, key, _sunday_table)
+
+    matches = []
+    comparisons = 0
+    s = 0
+    while s <= n - m:
+        j = 0
+        while j < m:
+            comparisons += 1
+            if p[j] != text[s + j]:
+                break
+            j += 1
+        if j == m:
+            matches.append(s)
+        if s + m >= n:
+            break
+        s += shift[text[s + m]]
+    return matches, comparisons
+
+
+# --- Multi-pattern matching ---------------------------------------------------
+# Inputs are (text, patterns); results map every pattern to its sorted list
+# of (possibly overlapping) match offsets.
+
+# Characters per piece when a str text is converted to automaton columns
+CODE_CHUNK = 1 << 16
+
+
+class _Columns(dict):
+    """Character -> automaton column, with ``other`` for unknown characters.
+
+    Latin-1 characters are all filled in up front so typical text never
+    reaches ``__missing__``.
+    """
+
+    def __init__(self, alphabet, other):
+        super().__init__(zip(map(chr, range(256)), [other] * 256))
+        self.update(alphabet)
+        self.other = other
+
+    def __missing__(self, ch):
+        return self.other
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton over flat, row-major tables.
+
+    Pattern characters are renumbered 0..sigma-1 and every other character
+    shares column ``sigma``, so the automaton has ``width = sigma + 1``
+    columns. ``delta[state * width + c]`` is the goto function completed
+    with failure transitions (one lookup per text character), ``fail`` holds
+    the failure links, ``terminal[state]`` the pattern ending at a state (or
+    -1) and ``out_link[state]`` the nearest terminal state on its failure
+    chain (or -1), so reporting k matches takes k steps.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        chars = sorted({ch for p in self.patterns for ch in p})
+        self.alphabet = {ch: i for i, ch in enumerate(chars)}
+        self.sigma = len(chars)
+        self.width = width = self.sigma + 1
+
+        # Trie (goto function); -1 marks a missing edge
+        delta = [-1] * width
+        terminal = [-1]
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                slot = state * width + self.alphabet[ch]
+                if delta[slot] == -1:
+                    delta[slot] = len(terminal)
+                    delta.extend([-1] * width)
+                    terminal.append(-1)
+                state = delta[slot]
+            if terminal[state] == -1:
+                terminal[state] = index
+
+        # Breadth-first failure links, completing delta into a DFA
+        states = len(terminal)
+        fail = [0] * states
+        out_link = [-1] * states
+        queue = []
+        for c in range(width):
+            child = delta[c]
+            if child == -1:
+                delta[c] = 0
+            else:
+                queue.append(child)
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            row = state * width
+            fail_row = fail[state] * width
+            for c in range(width):
+                child = delta[row + c]
+                if child == -1:
+                    delta[row + c] = delta[fail_row + c]
+                else:
+                    f = delta[fail_row + c]
+                    fail[child] = f
+                    out_link[child] = f if terminal[f] != -1 else out_link[f]
+                    queue.append(child)
+
+        self.delta = delta
+        self.fail = fail
+        self.terminal = terminal
+        self.out_link = out_link
+        # First state to report from: the state itself or its out link
+        self.first_out = [s if terminal[s] != -1 else out_link[s] for s in range(states)]
+        self.states = states
+
+    def _codes(self, text):
+        """Text as an iterable of column numbers (bytes-like text is not copied).
+
+        A str is converted ``CODE_CHUNK`` characters at a time as it is read,
+        never encoded whole before the scan starts.
+        """
+        classes = [self.sigma] * 256
+        for ch, c in self.alphabet.items():
+            code = ch if isinstance(ch, int) else ord(ch)
+            if code < 256:
+                classes[code] = c
+        if isinstance(text, str):
+            return chain.from_iterable(self._str_codes(text, classes))
+        if self.width <= 256 and not isinstance(text, memoryview):
+            return text.translate(bytes(classes))
+        return map(classes.__getitem__, text)
+
+    def _str_codes(self, text, classes):
+        """Column numbers of a str text, one chunk at a time."""
+        table = bytes(classes) if self.width <= 256 else None
+        columns = None
+        for start in range(0, len(text), CODE_CHUNK):
+            chunk = text[start:start + CODE_CHUNK]
+            try:
+                chunk = chunk.encode('latin-1')
+            except UnicodeEncodeError:
+                if columns is None:
+                    columns = _Columns(self.alphabet, self.sigma)
+                yield map(columns.__getitem__, chunk)
+                continue
+            yield chunk.translate(table) if table is not None else map(classes.__getitem__, chunk)
+
+    def search(self, text):
+        """Single pass over ``text``; returns (matches_per_pattern, transitions).
+
+        ``transitions`` counts automaton steps: one per text character plus
+        one per output link followed.
+        """
+        n = len(text)
+        hits = [[] for _ in self.patterns]
+        delta, width = self.delta, self.width
+        first_out, out_link, terminal = self.first_out, self.out_link, self.terminal
+        lengths = [len(p) for p in self.patterns]
+        transitions = n
+        state = 0
+        for i, c in enumerate(self._codes(text)):
+            state = delta[state * width + c]
+            o = first_out[state]
+            while o != -1:
+                p = terminal[o]
+                hits[p].append(i - lengths[p] + 1)
+                o = out_link[o]
+                transitions += 1
+
+        matches = {}
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                matches[pattern] = list(range(n + 1))
+            elif pattern not in matches:
+                matches[pattern] = hits[index]
+        return matches, transitions
+
+
+def aho_corasick(text, patterns):
+    """Aho-Corasick multi-pattern matching: one pass over the text for all patterns.
+
+    Returns (matches_per_pattern, transitions)
+    """
+    return AhoCorasick(patterns).search(text)
+
+
+def match_each_pattern(text, patterns, matcher):
+    """Baseline: run a single-pattern ``matcher`` once per pattern (k passes).
+
+    Returns (matches_per_pattern, total_comparisons)
+    """
+    matches = {}
+    comparisons = 0
+    for pattern in patterns:
+        if pattern in matches:
+            continue
+        found, count = matcher(text, pattern)
+        matches[pattern] = found
+        comparisons += count
     return matches, comparisons
+
+
+def multi_naive_search(text, patterns):
+    """Naive search repeated for every pattern."""
+    return match_each_pattern(text, patterns, naive_search)
+
+
+def multi_kmp_search(text, patterns):
+    """KMP search repeated for every pattern."""
+    return match_each_pattern(text, patterns, kmp_search)
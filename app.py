@@ -2,20 +2,35 @@ from flask import Flask, render_template, request, jsonify, session
 from flask_socketio import SocketIO, emit, join_room, leave_room
 import random
 import string
+import os
 import json
+import hashlib
 from datetime import datetime
 
 # Import your existing modules
-from utils.helpers import generate_input, get_unified_input
-from utils.profiler import run_algorithm
-from utils.scoring import score_algorithm
-from algorithms.library import algorithms
-from algorithms.knapsack import knapsack_dp
+from utils.helpers import get_unified_input, DEFAULT_PROFILE
+from utils.input_cache import input_cache
+from utils.executor import battle_executor
+from utils.profiler import LimitExceeded
+from utils.trace import tracer, INFO, ERROR
+from utils.validator import compute_expected, check_result, extract_result_and_comparisons, oracle_cache
+from utils.jobs import BattleJobQueue, QueueFull
+from utils.scoring import score_algorithm, central_time, intervals_overlap, reference_value
+from algorithms.library import algorithms, registry
 
 app = Flask(__name__)
 app.secret_key = 'algorithm-battlefield-secret-key-2024'
 socketio = SocketIO(app, cors_allowed_origins="*")
 
+# Hard per-contestant budgets for the sandboxed runner (BATTLE_SANDBOX=0 disables it)
+BATTLE_LIMITS = {
+    'cpu_seconds': float(os.environ.get('BATTLE_CPU_SECONDS', 10)),
+    'memory_mb': float(os.environ.get('BATTLE_MEMORY_MB', 512)),
+    'wall_seconds': float(os.environ.get('BATTLE_WALL_SECONDS', 15)),
+}
+if os.environ.get('BATTLE_SANDBOX', '1') == '0':
+    BATTLE_LIMITS = None
+
 # Game rooms storage
 rooms = {}
 active_battles = {}
@@ -76,219 +91,143 @@ def index():
     """Serve the main page"""
     return render_template('index.html')
 
+def precompute_json(payload):
+    """Serialize a static API payload once; returns ``(body, etag)``."""
+    body = json.dumps(payload, sort_keys=True)
+    return body, hashlib.sha1(body.encode()).hexdigest()
+
+def catalog_response(body, etag):
+    """Serve a precomputed body; a matching If-None-Match gets a 304."""
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.no_cache = True  # always revalidate, usually a 304
+    return response.make_conditional(request)
+
+# The catalog only changes with the code, so it is serialized once at startup
+CATEGORIES_RESPONSE = precompute_json({'categories': list(registry.categories)})
+ALGORITHMS_RESPONSES = {
+    category: precompute_json({'algorithms': [{
+        'key': algo['key'],
+        'name': algo['name'],
+        'description': algo.get('description', ''),
+        'time_complexity': algo.get('time_complexity', 'N/A'),
+        'tiers': list(algo['tiers'])
+    } for algo in registry.entries(category)]})
+    for category in registry.categories
+}
+
 @app.route('/api/categories')
 def get_categories():
     """API endpoint to get available algorithm categories"""
-    categories = sorted(algorithms.keys())
-    return jsonify({'categories': categories})
+    return catalog_response(*CATEGORIES_RESPONSE)
 
 @app.route('/api/algorithms/<category>')
 def get_algorithms(category):
     """API endpoint to get algorithms for a specific category"""
-    if category in algorithms:
-        algo_list = [{
-            'name': algo['name'], 
-            'description': algo.get('description', ''),
-            'time_complexity': algo.get('time_complexity', 'N/A')
-        } for algo in algorithms[category]]
-        return jsonify({'algorithms': algo_list})
+    if category in ALGORITHMS_RESPONSES:
+        return catalog_response(*ALGORITHMS_RESPONSES[category])
     return jsonify({'error': 'Category not found'}), 404
 
-@app.route('/api/battle', methods=['POST'])
-def execute_battle():
-    """Execute algorithm battle and return results"""
+def run_battle(data):
+    """Execute an algorithm battle described by a /api/battle payload.
+
+    Returns ``(results, status_code)``. Runs outside a request context so the
+    job queue can call it from its workers.
+    """
     try:
-        data = request.get_json()
-        
         # Extract battle parameters
         player1_data = data['player1']
         player2_data = data['player2']
-        input_size = data.get('input_size', 20)
+        input_size = int(data.get('input_size', 20))
+        seed = data.get('seed')
+        profile = data.get('profile', DEFAULT_PROFILE)
         
-        # Prepare input data for each player. If the client provided a custom_input
-        # in their selection, use that per-player; otherwise generate a default
-        # input for that player's selected category. This evaluates each player's
-        # algorithm on their own provided or generated input.
-        generated1 = generate_input(player1_data['category'], input_size)
-        generated2 = generate_input(player2_data['category'], input_size)
-
-        if 'custom_input' in player1_data and player1_data['custom_input'] is not None:
-            data1 = get_unified_input(player1_data['category'], player1_data['custom_input'], size=input_size, custom=True)
+        # Prepare input data for each player. A player's custom_input is used
+        # as-is; otherwise the input comes from the seeded input cache, so the
+        # same seed always reproduces the same battle. In shared-input mode
+        # both contestants run on the very same instance, which is the only
+        # way their timings are directly comparable.
+        def prepare_input(player_data):
+            if 'custom_input' in player_data and player_data['custom_input'] is not None:
+                return None, get_unified_input(player_data['category'], player_data['custom_input'], size=input_size, custom=True)
+            input_seed, generated = input_cache.get(player_data['category'], input_size, seed=seed, profile=profile)
+            return input_seed, get_unified_input(player_data['category'], generated, size=input_size, custom=False)
+
+        shared_input = bool(data.get('shared_input')) and \
+            player1_data['category'].lower() == player2_data['category'].lower()
+        seed1, data1 = prepare_input(player1_data)
+        if shared_input:
+            seed2, data2 = seed1, data1
         else:
-            data1 = get_unified_input(player1_data['category'], generated1, size=input_size, custom=False)
-
-        if 'custom_input' in player2_data and player2_data['custom_input'] is not None:
-            data2 = get_unified_input(player2_data['category'], player2_data['custom_input'], size=input_size, custom=True)
-        else:
-            data2 = get_unified_input(player2_data['category'], generated2, size=input_size, custom=False)
-        
-        # Find algorithm functions
-        # First try to find by algorithm_key if provided, then by name
-        player1_algo = None
-        if 'algorithm_key' in player1_data:
-            player1_algo = next((algo for algo in algorithms[player1_data['category']] 
-                               if algo.get('key') == player1_data['algorithm_key']), None)
-        if not player1_algo:
-            player1_algo = next((algo for algo in algorithms[player1_data['category']] 
-                               if algo['name'] == player1_data['algorithm']), None)
+            seed2, data2 = prepare_input(player2_data)
         
-        player2_algo = None
-        if 'algorithm_key' in player2_data:
-            player2_algo = next((algo for algo in algorithms[player2_data['category']] 
-                               if algo.get('key') == player2_data['algorithm_key']), None)
-        if not player2_algo:
-            player2_algo = next((algo for algo in algorithms[player2_data['category']] 
-                               if algo['name'] == player2_data['algorithm']), None)
+        # Find algorithm functions: by algorithm_key if provided, then by name,
+        # in the requested implementation tier (custom by default)
+        player1_algo = registry.find(player1_data['category'],
+                                     key=player1_data.get('algorithm_key'),
+                                     name=player1_data.get('algorithm'),
+                                     tier=player1_data.get('tier'))
+        player2_algo = registry.find(player2_data['category'],
+                                     key=player2_data.get('algorithm_key'),
+                                     name=player2_data.get('algorithm'),
+                                     tier=player2_data.get('tier'))
         
         if not player1_algo or not player2_algo:
-            return jsonify({'error': 'Algorithm not found'}), 404
+            return {'error': 'Algorithm not found'}, 404
         
         # Run algorithms
         func1 = player1_algo["func"]
         func2 = player2_algo["func"]
         
-        time1, mem1, correct1, result1 = run_algorithm(func1, *data1)
-        time2, mem2, correct2, result2 = run_algorithm(func2, *data2)
-
-        # Extract algorithm result value and comparison counts robustly.
-        # Algorithms may return:
-        # - value
-        # - (value, comparisons)
-        # - ((value, selection), comparisons)  (e.g., knapsack)
-        # We'll recursively search tuples/lists for an int comparisons value at the
-        # last position and return the main value and comparisons (or 0 if none).
-        def extract_result_and_comparisons(obj):
-            # If obj is not tuple/list, it's the value with no comparisons
-            if not isinstance(obj, (list, tuple)):
-                return obj, 0
-            # If tuple/list and last element is int, treat it as comparisons
-            if len(obj) >= 2 and isinstance(obj[-1], int):
-                value = obj[0]
-                comps = obj[-1]
-                return value, comps
-            # Otherwise, try to recurse into the first element
-            if len(obj) >= 1:
-                val, comps = extract_result_and_comparisons(obj[0])
-                # If comps found deeper, return it
-                return val, comps
-            return obj, 0
-
-        result1_val, comparisons1 = extract_result_and_comparisons(result1)
-        result2_val, comparisons2 = extract_result_and_comparisons(result2)
-        # Replace result1/result2 with the unwrapped values for later checks
-        result1 = result1_val
-        result2 = result2_val
+        # 'single' times one call per contestant; 'trials' runs the multi-trial
+        # engine and yields timing distributions instead of single floats
+        timing_mode = data.get('timing', 'single')
+        if timing_mode == 'trials':
+            (time1, mem1, correct1, result1), (time2, mem2, correct2, result2) = \
+                battle_executor.run_trials(func1, data1, func2, data2,
+                                           trials=int(data.get('trials', 15)),
+                                           limits=BATTLE_LIMITS)
+        else:
+            # Both contestants run at the same time on their own pinned cores
+            (time1, mem1, correct1, result1), (time2, mem2, correct2, result2) = \
+                battle_executor.run_pair(func1, data1, func2, data2, limits=BATTLE_LIMITS)
 
-        # --- compute expected results for correctness verification ---
-        def compute_expected(category, data_args):
-            """Return an expected result for common categories or None if unknown.
-
-            data_args is a tuple of arguments as returned by get_unified_input.
-            """
-            cat = category.lower()
-            try:
-                if cat == 'string matching':
-                    # data_args -> (text, pattern)
-                    text, pattern = data_args
-                    expected = [i for i in range(len(text)) if text.startswith(pattern, i)]
-                    return expected
-
-                if cat == 'sorting':
-                    # data_args -> (arr,)
-                    arr = data_args[0]
-                    return sorted(arr)
-
-                if cat == 'searching':
-                    # data_args -> (arr, target)
-                    arr, target = data_args
-                    # Many search implementations return an index or -1.
-                    # For correctness, consider whether the target exists in the array.
-                    return (target in arr)
-
-                if cat == 'subset generation':
-                    # data_args -> (arr,)
-                    arr = list(data_args[0])
-                    # Generate canonical subsets using itertools
-                    from itertools import chain, combinations
-                    def powerset(iterable):
-                        s = list(iterable)
-                        return chain.from_iterable(combinations(s, r) for r in range(len(s)+1))
-                    expected = [list(x) for x in powerset(arr)]
-                    return expected
-
-                if cat == "0/1 knapsack":
-                    # data_args -> (values, weights, capacity)
-                    values, weights, capacity = data_args
-                    # Use DP implementation as reference
-                    try:
-                        res = knapsack_dp(values, weights, capacity)
-                        # knapsack_dp may return ((value, selection), comparisons) or (value, selection)
-                        if isinstance(res, tuple) and len(res) == 2 and isinstance(res[0], tuple):
-                            best_value = res[0][0]
-                        elif isinstance(res, tuple) and len(res) >= 2:
-                            best_value = res[0]
-                        else:
-                            best_value = res
-                        return best_value
-                    except Exception as e:
-                        print(f"Error computing knapsack expected: {e}")
-                        return None
-
-            except Exception as e:
-                print(f"Error while computing expected for category {category}: {e}")
-                return None
-
-            return None
+        # Unwrap (value, comparisons) shapes; see extract_result_and_comparisons
+        result1, comparisons1 = extract_result_and_comparisons(result1)
+        result2, comparisons2 = extract_result_and_comparisons(result2)
 
+        # --- compute expected results for correctness verification ---
+        # Oracles are cached by input digest, so shared inputs and rematches
+        # skip the reference computation.
         expected1 = compute_expected(player1_data['category'], data1)
         expected2 = compute_expected(player2_data['category'], data2)
 
-        # Overwrite correctness where we can compute an expected value
-        # For string matching and sorting/subset/knapsack we can compare outputs
+        # Overwrite correctness where we can compute an expected value.
+        # Contestants stopped by a sandbox limit stay incorrect.
         try:
-            cat1 = player1_data['category'].lower()
-            if expected1 is not None:
-                if cat1 == 'string matching':
-                    correct1 = (result1 == expected1)
-                elif cat1 == 'sorting':
-                    correct1 = (result1 == expected1)
-                elif cat1 == 'searching':
-                    # expected1 is boolean whether target in arr
-                    correct1 = ((result1 != -1) == expected1)
-                elif cat1 == 'subset generation':
-                    # Compare as sets of tuples to ignore ordering
-                    set_res = set(tuple(sorted(x)) for x in result1) if result1 is not None else set()
-                    set_exp = set(tuple(sorted(x)) for x in expected1)
-                    correct1 = (set_res == set_exp)
-                elif cat1 == '0/1 knapsack':
-                    # expected1 is best value
-                    correct1 = (isinstance(result1, (list, tuple)) and result1[0] == expected1) or (result1 == expected1)
-
-            cat2 = player2_data['category'].lower()
-            if expected2 is not None:
-                if cat2 == 'string matching':
-                    correct2 = (result2 == expected2)
-                elif cat2 == 'sorting':
-                    correct2 = (result2 == expected2)
-                elif cat2 == 'searching':
-                    correct2 = ((result2 != -1) == expected2)
-                elif cat2 == 'subset generation':
-                    set_res = set(tuple(sorted(x)) for x in result2) if result2 is not None else set()
-                    set_exp = set(tuple(sorted(x)) for x in expected2)
-                    correct2 = (set_res == set_exp)
-                elif cat2 == '0/1 knapsack':
-                    correct2 = (isinstance(result2, (list, tuple)) and result2[0] == expected2) or (result2 == expected2)
+            if not isinstance(result1, LimitExceeded):
+                checked1 = check_result(player1_data['category'], result1, expected1)
+                if checked1 is not None:
+                    correct1 = checked1
+            if not isinstance(result2, LimitExceeded):
+                checked2 = check_result(player2_data['category'], result2, expected2)
+                if checked2 is not None:
+                    correct2 = checked2
         except Exception as e:
-            print(f"Error while validating results against expected: {e}")
+            tracer.event(ERROR, 'battle.validation_failed', error=str(e))
         
         # Calculate scores
-        fastest_time = min(time1, time2)
-        lowest_memory = min(mem1, mem2)
+        fastest_time = reference_value((time1, correct1), (time2, correct2))
+        lowest_memory = reference_value((mem1, correct1), (mem2, correct2))
         score1 = score_algorithm(correct1, time1, mem1, fastest_time, lowest_memory)
         score2 = score_algorithm(correct2, time2, mem2, fastest_time, lowest_memory)
         
-        # Determine winner
-        if score1 > score2:
+        # Determine winner. With timing distributions, overlapping confidence
+        # intervals mean neither contestant is measurably faster.
+        if timing_mode == 'trials' and correct1 == correct2 and intervals_overlap(time1, time2):
+            winner = "Draw"
+            winner_index = 0
+        elif score1 > score2:
             winner = "Player 1"
             winner_index = 1
         elif score2 > score1:
@@ -303,43 +242,126 @@ def execute_battle():
             'player1': {
                 'name': player1_algo['name'],  # Use the name from the algorithm object, not the key
                 'category': player1_data['category'],
+                'tier': player1_algo['tier'],
                 'result': str(result1),
-                'time': f"{time1:.6f}",
+                'time': f"{central_time(time1):.6f}",
                 'memory': f"{mem1:.2f}",
                 'correct': correct1,
                 'score': f"{score1:.3f}",
                 'comparisons': int(comparisons1),
-                'time_ms': f"{(time1 * 1000):.2f}"
+                'time_ms': f"{(central_time(time1) * 1000):.2f}",
+                'outcome': result1.outcome if isinstance(result1, LimitExceeded) else 'completed'
             },
             'player2': {
                 'name': player2_algo['name'],  # Use the name from the algorithm object, not the key
                 'category': player2_data['category'],
+                'tier': player2_algo['tier'],
                 'result': str(result2),
-                'time': f"{time2:.6f}",
+                'time': f"{central_time(time2):.6f}",
                 'memory': f"{mem2:.2f}",
                 'correct': correct2,
                 'score': f"{score2:.3f}",
                 'comparisons': int(comparisons2),
-                'time_ms': f"{(time2 * 1000):.2f}"
+                'time_ms': f"{(central_time(time2) * 1000):.2f}",
+                'outcome': result2.outcome if isinstance(result2, LimitExceeded) else 'completed'
             },
             'winner': winner,
             'winner_index': winner_index,
             'input_data': str(data1),
-            'input_size': input_size
+            'input_size': input_size,
+            'input_seeds': [seed1, seed2],
+            'shared_input': shared_input
         }
+        if timing_mode == 'trials':
+            results['player1']['timing'] = time1
+            results['player2']['timing'] = time2
         
-        # Debug: print comparison counts and full results so logs show what was returned
-        try:
-            print(f"DEBUG: comparisons1={comparisons1}, comparisons2={comparisons2}")
-            print(f"DEBUG: results payload: {json.dumps(results)}")
-        except Exception:
-            # Avoid failure in logging
-            pass
+        if tracer.enabled(INFO):
+            tracer.event(INFO, 'battle.done', winner=winner,
+                         player1=player1_algo['name'], player2=player2_algo['name'],
+                         comparisons1=int(comparisons1), comparisons2=int(comparisons2),
+                         time1=central_time(time1), time2=central_time(time2))
 
-        return jsonify(results)
+        return results, 200
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        tracer.event(ERROR, 'battle.failed', error=str(e))
+        return {'error': str(e)}, 500
+
+def emit_battle_result(job):
+    """Push a finished battle job to its room."""
+    if job.room_code is None:
+        return
+    if job.status == 'done':
+        socketio.emit('battle_result', {'job_id': job.job_id, **job.result}, room=job.room_code)
+    elif job.status == 'failed':
+        socketio.emit('battle_error', {'job_id': job.job_id, 'error': job.error}, room=job.room_code)
+
+
+def abort_battle(job):
+    """Stop a cancelled battle that is still running on the executor lanes."""
+    battle_executor.abort(job.worker)
+
+
+# Workers are SocketIO background tasks (green threads under eventlet) so they
+# can emit to rooms; the executor waits on the lanes in eventlet's thread pool
+battle_jobs = BattleJobQueue(
+    run_battle,
+    on_complete=emit_battle_result,
+    on_cancel=abort_battle,
+    concurrency=int(os.environ.get('BATTLE_JOB_CONCURRENCY', 2)),
+    max_queue=int(os.environ.get('BATTLE_JOB_QUEUE_DEPTH', 16)),
+    spawn=socketio.start_background_task,
+    make_queue=socketio.server.eio.create_queue,
+)
+
+@app.route('/api/battle', methods=['POST'])
+def execute_battle():
+    """Execute algorithm battle and return results.
+
+    With ``"async": true`` the battle is queued instead: the response is a job
+    id (202) and the results are emitted as ``battle_result`` to ``room_code``.
+    """
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict) or not data:
+        return jsonify({'error': 'Expected a JSON object describing the battle'}), 400
+    if not data.get('async'):
+        results, status = run_battle(data)
+        return jsonify(results), status
+
+    room_code = data.get('room_code')
+    sids = []
+    if room_code in rooms:
+        sids = [player['sid'] for player in rooms[room_code].players.values()]
+    try:
+        job = battle_jobs.submit(data, room_code=room_code, sids=sids)
+    except QueueFull:
+        return jsonify({'error': 'Battle queue is full, try again shortly'}), 503
+    return jsonify({'job_id': job.job_id, 'status': job.status}), 202
+
+@app.route('/api/battle/jobs/<job_id>')
+def get_battle_job(job_id):
+    """Poll the state of a queued battle"""
+    job = battle_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/api/inputs/stats')
+def get_input_stats():
+    """Input and oracle cache occupancy and hit/miss counters"""
+    return jsonify({'inputs': input_cache.stats(), 'oracles': oracle_cache.stats()})
+
+@app.route('/api/trace')
+def get_trace():
+    """Query the most recent trace events (?level=debug&event=battle&limit=100)"""
+    try:
+        events = tracer.query(level=request.args.get('level', 'debug'),
+                              name=request.args.get('event'),
+                              limit=int(request.args.get('limit', 100)))
+    except (KeyError, ValueError):
+        return jsonify({'error': 'Invalid trace query'}), 400
+    return jsonify({'settings': tracer.settings(), 'events': events})
 
 # FIXED: Only one create_room endpoint
 @app.route('/api/room/create', methods=['POST'])
@@ -370,6 +392,8 @@ def handle_connect():
 @socketio.on('disconnect')
 def handle_disconnect():
     print(f"Client disconnected: {request.sid}")
+    # Abandoned battles should not keep burning CPU: running ones are killed
+    battle_jobs.cancel_for_sid(request.sid)
     # Clean up rooms if creator disconnects
     for room_code, room in list(rooms.items()):
         if room.creator_sid == request.sid:
@@ -432,4 +456,7 @@ def handle_player_selection(data):
         }, room=room_code)
 
 if __name__ == '__main__':
+    battle_executor.start()
+    # Keep the default battle size warm for every category
+    input_cache.prewarm((category, 20, DEFAULT_PROFILE) for category in algorithms)
     socketio.run(app, debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+Benchmark regression suite.
+
+Record a baseline:
+    python tools/benchmark.py --record tools/benchmark_baseline.json
+Check the current tree against it (exit code 1 on regression):
+    python tools/benchmark.py --check tools/benchmark_baseline.json --time-threshold 0.3
+"""
+import argparse
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.benchmark import (run_suite, save_baseline, load_baseline, compare,
+                             format_report, DEFAULT_THRESHOLDS)
+
+
+def print_record(record):
+    name = record['algorithm']
+    if record.get('tier', 'custom') != 'custom':
+        name = f"{name}@{record['tier']}"
+    if record['status'] == 'ok':
+        print(f"{record['category']:>18} {name:<32} n={record['size']:<7} "
+              f"{record['time_median'] * 1000:10.3f}ms {record['memory_mb']:9.3f}MB "
+              f"{record['comparisons']:>10} comps{'' if record['correct'] else '  WRONG'}")
+    else:
+        print(f"{record['category']:>18} {name:<32} n={record['size']:<7} {record['status']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark every algorithm in the library')
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--record', metavar='PATH', help='write a new baseline')
+    mode.add_argument('--check', metavar='PATH', help='compare against a baseline')
+    parser.add_argument('--category', action='append', help='limit to a category (repeatable)')
+    parser.add_argument('--size', type=int, action='append', help='override the size ladder')
+    parser.add_argument('--trials', type=int, default=7)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--time-threshold', type=float, default=DEFAULT_THRESHOLDS['time'])
+    parser.add_argument('--memory-threshold', type=float, default=DEFAULT_THRESHOLDS['memory'])
+    parser.add_argument('--comparisons-threshold', type=float, default=DEFAULT_THRESHOLDS['comparisons'])
+    args = parser.parse_args()
+
+    if args.check:
+        # Fail fast on a missing or incompatible baseline
+        baseline = load_baseline(args.check)
+
+    report = run_suite(categories=args.category, sizes=args.size, trials=args.trials,
+                       seed=args.seed, progress=print_record)
+
+    if args.record:
+        save_baseline(report, args.record)
+        print(f"\nBaseline written to {args.record}")
+        return 0
+
+    regressions = compare(report, baseline, {
+        'time': args.time_threshold,
+        'memory': args.memory_threshold,
+        'comparisons': args.comparisons_threshold,
+    })
+    print()
+    print(format_report(regressions))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,10 +2,11 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from algorithms.library import algorithms
+from algorithms.library import registry
 from utils.profiler import run_algorithm
 from utils.helpers import get_unified_input
-from utils.scoring import score_algorithm
+from utils.scoring import score_algorithm, reference_value
+from utils.validator import compute_expected, check_result
 
 # Player 1: generated-like input (no target)
 player1_data = {
@@ -37,8 +38,7 @@ else:
 
 # Locate algorithm
 def find_algo(category, name):
-    cat = category.lower()
-    return next((a for a in algorithms[cat] if a['name'] == name), None)
+    return registry.find(category.lower(), name=name)
 
 algo1 = find_algo(player1_data['category'], player1_data['algorithm'])
 algo2 = find_algo(player2_data['category'], player2_data['algorithm'])
@@ -67,11 +67,16 @@ else:
 print('player1 result:', result_val1, 'comparisons:', comparisons1, 'time:', time1)
 print('player2 result:', result_val2, 'comparisons:', comparisons2, 'time:', time2)
 
+# Correctness through the same cached oracle the server uses
+correct1 = check_result('searching', result_val1, compute_expected('searching', data1))
+correct2 = check_result('searching', result_val2, compute_expected('searching', data2))
+print('correct:', correct1, correct2)
+
 # Score
-fastest_time = min(time1, time2)
-lowest_memory = min(mem1, mem2)
-score1 = score_algorithm(True, time1, mem1, fastest_time, lowest_memory)
-score2 = score_algorithm(True, time2, mem2, fastest_time, lowest_memory)
+fastest_time = reference_value((time1, correct1), (time2, correct2))
+lowest_memory = reference_value((mem1, correct1), (mem2, correct2))
+score1 = score_algorithm(correct1, time1, mem1, fastest_time, lowest_memory)
+score2 = score_algorithm(correct2, time2, mem2, fastest_time, lowest_memory)
 print('scores', score1, score2)
 if score1 > score2:
     print('winner: Player 1')
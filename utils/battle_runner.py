@@ -1,5 +1,6 @@
-from .profiler import run_algorithm
-from .scoring import score_algorithm
+from .executor import battle_executor
+from .scoring import score_algorithm, reference_value
+from .validator import compute_expected, check_result, extract_result_and_comparisons
 from algorithms.library import algorithms 
 
 def execute_battle(category, user1_algo, user2_algo, data1, data2):
@@ -7,45 +8,30 @@ def execute_battle(category, user1_algo, user2_algo, data1, data2):
     func2 = user2_algo["func"]
     cat = category.lower()
 
-    # --- Run User 1 ---
-    if cat == "searching":
-        arr1, target1 = data1
-        time1, mem1, correct1, result1 = run_algorithm(func1, arr1, target1)
-    elif cat in ("graph", "shortest_path", "mst"):
-        graph1, start1 = data1
-        time1, mem1, correct1, result1 = run_algorithm(func1, graph1, start1)
-    elif cat == "string matching":
-        text1, pattern1 = data1
-        time1, mem1, correct1, result1 = run_algorithm(func1, text1, pattern1)
-    elif cat == "sorting":
-        time1, mem1, correct1, result1 = run_algorithm(func1, data1)
-    elif cat in ("subset generation", "subset_generation"):
-        # Pass the array directly for subset generation
-        time1, mem1, correct1, result1 = run_algorithm(func1, data1)
-    else:
-        time1, mem1, correct1, result1 = run_algorithm(func1, data1)
+    # --- Run both users concurrently ---
+    def call_args(data):
+        if cat in ("searching", "graph", "shortest path", "shortest_path", "mst",
+                   "string matching", "multi-pattern matching", "0/1 knapsack"):
+            return tuple(data)
+        # Sorting / subset generation / fallback: pass the data as one argument
+        return (data,)
 
-    # --- Run User 2 ---
-    if cat == "searching":
-        arr2, target2 = data2
-        time2, mem2, correct2, result2 = run_algorithm(func2, arr2, target2)
-    elif cat in ("graph", "shortest_path", "mst"):
-        graph2, start2 = data2
-        time2, mem2, correct2, result2 = run_algorithm(func2, graph2, start2)
-    elif cat == "string matching":
-        text2, pattern2 = data2
-        time2, mem2, correct2, result2 = run_algorithm(func2, text2, pattern2)
-    elif cat == "sorting":
-        time2, mem2, correct2, result2 = run_algorithm(func2, data2)
-    elif cat in ("subset generation", "subset_generation"):
-        # Pass the array directly for subset generation
-        time2, mem2, correct2, result2 = run_algorithm(func2, data2)
-    else:
-        time2, mem2, correct2, result2 = run_algorithm(func2, data2)
+    (time1, mem1, correct1, result1), (time2, mem2, correct2, result2) = \
+        battle_executor.run_pair(func1, call_args(data1), func2, call_args(data2))
+
+    # --- Check results against the (cached) oracle ---
+    expected1 = compute_expected(category, call_args(data1))
+    expected2 = compute_expected(category, call_args(data2))
+    if correct1:
+        checked1 = check_result(category, extract_result_and_comparisons(result1)[0], expected1)
+        correct1 = correct1 if checked1 is None else checked1
+    if correct2:
+        checked2 = check_result(category, extract_result_and_comparisons(result2)[0], expected2)
+        correct2 = correct2 if checked2 is None else checked2
 
     # --- Scoring ---
-    fastest_time = min(time1, time2)
-    lowest_memory = min(mem1, mem2)
+    fastest_time = reference_value((time1, correct1), (time2, correct2))
+    lowest_memory = reference_value((mem1, correct1), (mem2, correct2))
 
     score1 = score_algorithm(correct1, time1, mem1, fastest_time, lowest_memory)
     score2 = score_algorithm(correct2, time2, mem2, fastest_time, lowest_memory)
@@ -0,0 +1,181 @@
+"""
+Benchmark regression suite over every algorithm in ``algorithms.library``.
+
+Each algorithm is run on seeded inputs across a per-category size ladder and
+its median time, peak memory and comparison count are recorded. Results are
+saved as versioned JSON baselines and later runs are compared against them.
+"""
+import json
+import platform
+import sys
+from datetime import datetime
+
+from algorithms.library import registry
+from .helpers import generate_input, get_unified_input
+from .profiler import run_algorithm, measure, LimitExceeded
+from .validator import compute_expected, check_result, extract_result_and_comparisons
+
+SCHEMA_VERSION = 1
+
+# Input sizes per category. Slow quadratic/exponential contestants are still
+# included: the sandbox limits below stop them instead of stalling the suite.
+# Subset generation and knapsack stay within the caps of ``generate_input``
+# (6 elements, 10 items); larger sizes would repeat the same input.
+SIZE_LADDER = {
+    "sorting": [100, 500, 2000],
+    "searching": [1000, 10000, 100000],
+    "string matching": [100, 1000, 10000],
+    "multi-pattern matching": [100, 1000, 10000],
+    "graph": [100, 1000, 10000],
+    "shortest path": [20, 100, 300],
+    "mst": [100, 1000, 10000],
+    "subset generation": [2, 4, 6],
+    "0/1 knapsack": [4, 7, 10],
+}
+
+DEFAULT_THRESHOLDS = {"time": 0.25, "memory": 0.25, "comparisons": 0.0}
+# Absolute changes below these are measurement noise, whatever the ratio
+NOISE_FLOOR = {"time": 5e-6, "memory": 0.01, "comparisons": 0}
+DEFAULT_LIMITS = {"cpu_seconds": 20, "memory_mb": 1024, "wall_seconds": 30}
+
+
+def result_key(category, algo_key, size, tier="custom"):
+    if tier != "custom":
+        algo_key = f"{algo_key}@{tier}"
+    return f"{category}/{algo_key}/{size}"
+
+
+def fitting_trials(probe_time, trials, limits, warmup=1):
+    """How many of ``trials`` fit in half the smallest time budget of
+    ``limits``, given one call takes ``probe_time`` (warmup and loop scaling
+    take ``warmup + 1`` calls more). 0 means the call is too slow to repeat.
+    """
+    budgets = [limits[b] for b in ("cpu_seconds", "wall_seconds") if limits and limits.get(b)]
+    if not budgets or probe_time <= 0:
+        return trials
+    calls = int(0.5 * min(budgets) / probe_time) - warmup - 1
+    return max(0, min(trials, calls))
+
+
+def benchmark_algorithm(category, algo, size, seed=0, trials=7, limits=DEFAULT_LIMITS):
+    """Benchmark one algorithm at one size; returns a JSON-able record.
+
+    The timing trials run in one sandbox under the same budgets as the probe
+    call and are cut short for slow contestants (``fitting_trials``); one
+    that is too slow to repeat is reported with its probe time alone.
+    """
+    data = get_unified_input(category, generate_input(category, size, seed=seed))
+    probe_time, memory_used, ok, result = run_algorithm(algo["func"], *data, limits=limits)
+    record = {"category": category, "algorithm": algo["key"], "tier": algo.get("tier", "custom"),
+              "size": size, "seed": seed}
+    if isinstance(result, LimitExceeded):
+        record.update(status=result.outcome, correct=False)
+        return record
+    if not ok:
+        record.update(status="error", correct=False)
+        return record
+
+    value, comparisons = extract_result_and_comparisons(result)
+    checked = check_result(category, value, compute_expected(category, data))
+    trials = fitting_trials(probe_time, trials, limits)
+    timing = measure(algo["func"], data, trials=trials, limits=limits) if trials else None
+    if not isinstance(timing, dict):
+        timing = {"median": probe_time, "iqr": 0.0, "trials": 1}
+    record.update(
+        status="ok",
+        correct=ok if checked is None else checked,
+        time_median=timing["median"],
+        time_iqr=timing["iqr"],
+        trials=timing["trials"],
+        memory_mb=memory_used,
+        comparisons=int(comparisons),
+    )
+    return record
+
+
+def run_suite(categories=None, sizes=None, trials=7, seed=0, progress=None):
+    """Benchmark every registered algorithm; returns a versioned baseline dict.
+
+    Built-in and NumPy tiers are benchmarked next to their custom versions
+    (keyed ``algo@tier``), so a report shows the interpreter-overhead gap.
+    """
+    results = {}
+    for category in registry.categories:
+        if categories and category not in categories:
+            continue
+        contestants = list(registry.entries(category))
+        contestants += [tier_entry for _, tier_entry in registry.tier_entries(category)]
+        for size in (sizes or SIZE_LADDER.get(category, [20])):
+            for algo in contestants:
+                record = benchmark_algorithm(category, algo, size, seed=seed, trials=trials)
+                results[result_key(category, algo["key"], size, algo["tier"])] = record
+                if progress:
+                    progress(record)
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def save_baseline(report, path):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline.get("schema_version") != SCHEMA_VERSION:
+        raise ValueError(f"Baseline {path} has schema version "
+                         f"{baseline.get('schema_version')}, expected {SCHEMA_VERSION}")
+    return baseline
+
+
+def compare(current, baseline, thresholds=DEFAULT_THRESHOLDS):
+    """List regressions of ``current`` against ``baseline``.
+
+    A metric regresses when it exceeds the baseline by more than its
+    threshold (0.25 = 25% worse). An algorithm that used to pass and now
+    fails, times out or returns a wrong answer is always a regression.
+    """
+    regressions = []
+    metrics = (("time", "time_median"), ("memory", "memory_mb"), ("comparisons", "comparisons"))
+    for key, old in baseline["results"].items():
+        new = current["results"].get(key)
+        if new is None:
+            continue
+        if old.get("status") == "ok" and old.get("correct"):
+            if new.get("status") != "ok":
+                regressions.append({"key": key, "metric": "status", "current": new.get("status")})
+                continue
+            if not new.get("correct"):
+                regressions.append({"key": key, "metric": "status", "current": "incorrect"})
+                continue
+        if old.get("status") != "ok" or new.get("status") != "ok":
+            continue
+        for name, field in metrics:
+            before, after = old.get(field), new.get(field)
+            if before is None or after is None:
+                continue
+            if after > before * (1 + thresholds.get(name, 0.0)) and after - before > NOISE_FLOOR[name]:
+                regressions.append({"key": key, "metric": name, "baseline": before, "current": after,
+                                    "change": (after / before - 1) if before else float("inf")})
+    return regressions
+
+
+def format_report(regressions):
+    """Human-readable regression table."""
+    if not regressions:
+        return "No regressions."
+    lines = [f"{len(regressions)} regression(s):"]
+    for r in regressions:
+        if r["metric"] == "status":
+            lines.append(f"  {r['key']}: was ok, now {r['current']}")
+        else:
+            lines.append(f"  {r['key']}: {r['metric']} {r['baseline']:.6g} -> {r['current']:.6g} "
+                         f"(+{r['change'] * 100:.1f}%)")
+    return "\n".join(lines)
@@ -0,0 +1,257 @@
+"""
+Battle executor: runs both contestants at the same time in isolated, CPU-pinned
+worker processes so one player's run cannot disturb the other's timings.
+"""
+import os
+import signal
+import sys
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pickle import PicklingError
+
+from .jobs import current_worker
+from .profiler import run_algorithm, run_trials
+from .trace import tracer, ERROR, WARNING
+
+# Errors that mean the lanes themselves are unusable, as opposed to a
+# contestant misbehaving inside one
+POOL_FAILURES = (BrokenProcessPool, PicklingError, OSError)
+
+
+class BattleCancelled(Exception):
+    """Raised in the worker whose in-flight battle was aborted."""
+
+
+def _available_cores():
+    """Return the CPU cores this process is allowed to run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _pin_to_core(core):
+    """Worker initializer: pin the worker process to a single core."""
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {core})
+        except OSError:
+            # Core not available (e.g. restricted cpuset) - run unpinned
+            pass
+
+
+def _init_lane(core):
+    """Worker initializer: own process group (so ``abort`` also reaches the
+    sandbox children a lane forks) and a pinned core."""
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    _pin_to_core(core)
+
+
+def _kill_lane(pid):
+    """Kill a lane worker together with any sandbox child it is waiting on."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(pid, signal.SIGKILL)
+        else:
+            os.kill(pid, signal.SIGTERM)
+    except OSError:
+        # Already gone
+        pass
+
+
+def _warmup():
+    """No-op task used to spawn workers before the first battle."""
+    return os.getpid()
+
+
+def _traced(settings, fn, *args, **kwargs):
+    """Run ``fn`` in a worker with the parent's trace settings.
+
+    Returns ``(outcome, events)`` so the parent can merge the worker's trace
+    events into its own buffer.
+    """
+    tracer.configure(**settings)
+    tracer.drain()
+    return fn(*args, **kwargs), tracer.drain()
+
+
+def _wait(future):
+    """Block until ``future`` is done without stalling the eventlet hub.
+
+    On the server's hub thread (request handlers and the job queue's green
+    workers) a plain ``future.result()`` would freeze every other client for
+    the length of the battle, so the wait is handed to eventlet's OS thread
+    pool. Other threads (the CLI) simply block.
+    """
+    if 'eventlet' in sys.modules and threading.current_thread() is threading.main_thread():
+        from eventlet import tpool
+        return tpool.execute(future.result)
+    return future.result()
+
+
+class BattleExecutor:
+    """Pre-warmed pool of single-process lanes, one lane per contestant.
+
+    Each lane is its own single-worker process pinned to a distinct core, so
+    both algorithms run concurrently and in separate interpreters (separate
+    heaps, separate GC, separate caches where the hardware allows it).
+    """
+
+    def __init__(self, lanes=2):
+        self.lanes = lanes
+        self._pools = None
+        self._pids = []
+        self._generation = 0
+        self._running = set()
+        self._aborted = set()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Spawn and warm up the worker processes (idempotent)."""
+        with self._lock:
+            if self._pools is not None:
+                return
+            cores = _available_cores()
+            pools = [
+                ProcessPoolExecutor(max_workers=1, initializer=_init_lane,
+                                    initargs=(cores[i % len(cores)],))
+                for i in range(self.lanes)
+            ]
+            # A single-worker lane never replaces its process, so the pid
+            # reported at warmup stays valid until the pool breaks
+            self._pids = [future.result() for future in [pool.submit(_warmup) for pool in pools]]
+            self._pools = pools
+
+    def shutdown(self):
+        """Stop all worker processes."""
+        with self._lock:
+            if self._pools is None:
+                return
+            for pool in self._pools:
+                pool.shutdown(wait=False, cancel_futures=True)
+            self._pools = None
+
+    def abort(self, owner):
+        """Kill the lanes if worker ``owner`` (see ``jobs.current_worker``) has
+        a battle running on them.
+
+        The owner's call raises ``BattleCancelled``; battles from other workers
+        that were sharing the lanes are retried on fresh ones. Returns whether
+        anything was killed.
+        """
+        with self._lock:
+            if owner not in self._running or self._pools is None:
+                return False
+            self._aborted.add(owner)
+            pools, pids = self._pools, self._pids
+            self._pools, self._pids = None, []
+            self._generation += 1
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+        for pid in pids:
+            _kill_lane(pid)
+        tracer.event(WARNING, 'executor.aborted', lanes=len(pids))
+        return True
+
+    def _lanes(self):
+        """Start the lanes if needed and return ``(pools, generation)``."""
+        self.start()
+        with self._lock:
+            if self._pools is None:
+                raise BrokenProcessPool("lanes were aborted while starting")
+            return self._pools, self._generation
+
+    @contextmanager
+    def _in_flight(self):
+        """Mark the calling worker as running a battle, for ``abort``."""
+        owner = current_worker()
+        with self._lock:
+            self._running.add(owner)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._running.discard(owner)
+                self._aborted.discard(owner)
+
+    def _recover(self, error, generation, retry):
+        """Decide what to do after a pool failure: True retries on fresh lanes,
+        False falls back to running in-process."""
+        with self._lock:
+            if current_worker() in self._aborted:
+                raise BattleCancelled("battle aborted") from error
+            aborted_elsewhere = generation is not None and generation != self._generation
+        if retry and aborted_elsewhere:
+            return True
+        tracer.event(WARNING, 'executor.unavailable', error=str(error))
+        self.shutdown()
+        return False
+
+    @staticmethod
+    def _collect(future):
+        outcome, events = _wait(future)
+        tracer.ingest(events)
+        return outcome
+
+    def run_pair(self, func1, args1, func2, args2, limits=None):
+        """Run both contestants concurrently.
+
+        Returns two ``(time, mem, correct, result)`` tuples exactly as
+        ``run_algorithm`` would; ``limits`` enables its sandboxed mode. If the
+        pool is unusable (no process support, unpicklable input, crashed
+        worker) the pair falls back to running in-process, one after the
+        other. Any other error from a lane only fails that contestant, and
+        ``abort`` makes the call raise ``BattleCancelled``.
+        """
+        with self._in_flight():
+            for retry in (True, False):
+                generation = None
+                try:
+                    pools, generation = self._lanes()
+                    settings = tracer.settings()
+                    future1 = pools[0].submit(_traced, settings, run_algorithm, func1, *args1,
+                                              limits=limits)
+                    future2 = pools[1 % self.lanes].submit(_traced, settings, run_algorithm,
+                                                           func2, *args2, limits=limits)
+                    outcomes = []
+                    for func, future in ((func1, future1), (func2, future2)):
+                        try:
+                            outcomes.append(self._collect(future))
+                        except POOL_FAILURES:
+                            raise
+                        except Exception as e:
+                            tracer.event(ERROR, 'algorithm.failed', func=func.__name__,
+                                         error=str(e))
+                            outcomes.append((0.0, 0.0, False, None))
+                    return tuple(outcomes)
+                except POOL_FAILURES as e:
+                    if not self._recover(e, generation, retry):
+                        break
+        return (run_algorithm(func1, *args1, limits=limits),
+                run_algorithm(func2, *args2, limits=limits))
+
+    def run_trials(self, func1, args1, func2, args2, **options):
+        """Run the multi-trial timing engine for both contestants.
+
+        Trials must interleave A, B, A, B in a single process, so the whole
+        engine runs in one lane rather than across two. Only pool failures
+        fall back to running in-process; other errors propagate.
+        """
+        with self._in_flight():
+            for retry in (True, False):
+                generation = None
+                try:
+                    pools, generation = self._lanes()
+                    future = pools[0].submit(_traced, tracer.settings(), run_trials,
+                                             func1, args1, func2, args2, **options)
+                    return self._collect(future)
+                except POOL_FAILURES as e:
+                    if not self._recover(e, generation, retry):
+                        break
+        return run_trials(func1, args1, func2, args2, **options)
+
+
+# Shared executor used by the web server and the CLI runner
+battle_executor = BattleExecutor()
@@ -1,4 +1,21 @@
 import random
+import re
+
+from algorithms.csr import CSRGraph
+from algorithms.shortest_path import landmark_tables
+
+DEFAULT_PROFILE = "random"
+# Workload shapes accepted by generate_input, per category
+INPUT_PROFILES = {
+    "sorting": ["random", "sorted", "reversed", "nearly_sorted", "few_unique"],
+    "searching": ["random", "batch"],
+    "shortest path": ["random", "point_to_point", "negative_weights"],
+    "multi-pattern matching": ["random", "many"],
+    "0/1 knapsack": ["random", "large"],
+}
+# Pattern count per multi-pattern matching profile
+MULTI_PATTERN_COUNTS = {"random": 16, "many": 256}
+
 def choose_category(algorithms):
     """Let the user choose a category of algorithms with validation."""
     categories = sorted(algorithms.keys())
@@ -46,102 +63,224 @@ def choose_algorithm(category, player_num, algorithms, taken_algo=None):
             print("❌ Invalid choice. Please select a valid algorithm number.")
 
 
-def generate_input(category, size=20):
-    """Generate appropriate input for each algorithm category."""
+def generate_input(category, size=20, seed=None, profile=DEFAULT_PROFILE):
+    """Generate appropriate input for each algorithm category.
+
+    The same ``(category, size, seed, profile)`` always yields the same input;
+    ``seed=None`` draws from fresh randomness. ``profile`` selects a workload
+    shape where the category supports more than one (see ``INPUT_PROFILES``).
+    """
     category = category.lower()
+    rng = random.Random(seed)
 
     if category == "sorting":
         # Sorting: Array of numbers to sort
-        return random.sample(range(1, size * 10), size)
+        if profile == "few_unique":
+            return [rng.randint(1, 5) for _ in range(size)]
+        arr = rng.sample(range(1, size * 10), size)
+        if profile == "sorted":
+            arr.sort()
+        elif profile == "reversed":
+            arr.sort(reverse=True)
+        elif profile == "nearly_sorted":
+            arr.sort()
+            for _ in range(max(1, size // 20)):
+                i, j = rng.randrange(size), rng.randrange(size)
+                arr[i], arr[j] = arr[j], arr[i]
+        return arr
 
     elif category == "searching":
         # Searching: Array + target value
-        arr = sorted(random.sample(range(1, size * 10), size))
-        target = random.choice(arr) if random.random() > 0.3 else random.randint(1, size * 10)
+        arr = sorted(rng.sample(range(1, size * 10), size))
+        if profile == "batch":
+            # Query throughput: one array, ``size`` targets (about 70% present)
+            targets = [rng.choice(arr) if rng.random() > 0.3 else rng.randint(1, size * 10)
+                       for _ in range(size)]
+            return arr, targets
+        target = rng.choice(arr) if rng.random() > 0.3 else rng.randint(1, size * 10)
         return arr, target
 
     elif category == "string matching":
         # String matching: Text + pattern to search for
         letters = "abcdefghijklmnopqrstuvwxyz"
         text_length = max(50, size * 3)  # Longer text for meaningful search
-        text = "".join(random.choice(letters) for _ in range(text_length))
+        text = "".join(rng.choice(letters) for _ in range(text_length))
         
         # Create pattern that exists in text (70% chance) or random pattern (30% chance)
-        if random.random() < 0.7:
+        if rng.random() < 0.7:
             pattern_size = max(3, size // 4)
-            start = random.randint(0, len(text) - pattern_size)
+            start = rng.randint(0, len(text) - pattern_size)
             pattern = text[start:start + pattern_size]
         else:
             pattern = "xyz123"  # Pattern that likely won't be found
         return text, pattern
 
-    elif category == "graph":
-        # Graph traversal: Adjacency list + starting node
-        nodes = min(size, 10)  # Limit graph size for performance
-        node_names = [chr(65 + i) for i in range(nodes)]
-        
-        # Create adjacency list representation
-        graph = {node: [] for node in node_names}
-        
-        # Add random edges (undirected graph)
-        for i in range(nodes):
-            for j in range(i + 1, nodes):
-                if random.random() < 0.4:  # 40% chance of edge
-                    graph[node_names[i]].append(node_names[j])
-                    graph[node_names[j]].append(node_names[i])
-        
-        start_node = random.choice(node_names)
-        return graph, start_node
+    elif category == "multi-pattern matching":
+        return generate_multi_pattern_input(size, MULTI_PATTERN_COUNTS.get(profile, 16), rng)
 
-    elif category == "shortest path":
-        # Shortest path: Weighted graph + starting node
-        nodes = min(size, 8)  # Smaller for shortest path algorithms
-        node_names = [chr(65 + i) for i in range(nodes)]
-        
-        # Create weighted adjacency list
-        graph = {node: [] for node in node_names}
-        
-        # Add weighted edges
-        for i in range(nodes):
-            for j in range(nodes):
-                if i != j and random.random() < 0.5:
-                    weight = random.randint(1, 20)
-                    graph[node_names[i]].append((node_names[j], weight))
-        
-        start_node = random.choice(node_names)
-        return graph, start_node
+    elif category == "shortest path" and profile in ("point_to_point", "negative_weights"):
+        # Point-to-point queries; negative_weights adds negative edges (no negative cycles)
+        graph, start = generate_graph_input(category, size, rng,
+                                            negative_weights=profile == "negative_weights")
+        if profile == "point_to_point":
+            # Built once per input and pickled with the graph, so A* battles
+            # are not billed for landmark preprocessing
+            landmark_tables(graph)
+        return graph, start, rng.randrange(graph.n)
 
-    elif category == "mst":
-        # MST: Weighted undirected graph
-        nodes = min(size, 8)
-        node_names = [chr(65 + i) for i in range(nodes)]
-        
-        # Create edge list for MST algorithms
-        edges = []
-        for i in range(nodes):
-            for j in range(i + 1, nodes):
-                if random.random() < 0.6:  # 60% chance of edge
-                    weight = random.randint(1, 25)
-                    edges.append((node_names[i], node_names[j], weight))
-        
-        return edges, node_names
+    elif category in ("graph", "shortest path", "mst"):
+        return generate_graph_input(category, size, rng)
 
     elif category == "subset generation":
         # Subset generation: Array of elements
         elements = list(range(1, min(size, 6) + 1))  # Limit to 6 elements max
         return elements
         
+    elif category == "0/1 knapsack" and profile == "large":
+        # Large instances: capacities in the millions with small values, the
+        # regime for DP-by-value, Pareto-frontier DP and meet-in-the-middle
+        num_items = size
+        values = [rng.randint(1, 100) for _ in range(num_items)]
+        weights = [rng.randint(10_000, 1_000_000) for _ in range(num_items)]
+        capacity = sum(weights) // 2
+        return values, weights, capacity
+
     elif category == "0/1 knapsack":
         # Generate items with values and weights
         num_items = min(size, 10)  # Limit items for performance
-        values = [random.randint(10, 100) for _ in range(num_items)]
-        weights = [random.randint(5, 30) for _ in range(num_items)]
-        capacity = random.randint(sum(weights) // 3, sum(weights) // 2)  # Make it challenging
+        values = [rng.randint(10, 100) for _ in range(num_items)]
+        weights = [rng.randint(5, 30) for _ in range(num_items)]
+        capacity = rng.randint(sum(weights) // 3, sum(weights) // 2)  # Make it challenging
         return values, weights, capacity
 
     else:
         # Fallback: return simple array
-        return random.sample(range(1, size * 10), size)
+        return rng.sample(range(1, size * 10), size)
+
+def generate_multi_pattern_input(size, pattern_count=16, rng=None):
+    """Text plus ``pattern_count`` distinct patterns for multi-pattern matching.
+
+    The text has ``max(50, size * 3)`` letters like the single-pattern
+    workload. About 70% of the patterns (3-8 letters) are cut from the text
+    so they match at least once; the rest are random and mostly absent.
+    """
+    rng = rng or random.Random()
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    text_length = max(50, size * 3)
+    text = "".join(rng.choice(letters) for _ in range(text_length))
+    patterns = []
+    seen = set()
+    attempts = 0
+    while len(patterns) < pattern_count and attempts < pattern_count * 20:
+        attempts += 1
+        length = rng.randint(3, 8)
+        if rng.random() < 0.7:
+            start = rng.randint(0, len(text) - length)
+            pattern = text[start:start + length]
+        else:
+            pattern = "".join(rng.choice(letters) for _ in range(length))
+        if pattern not in seen:
+            seen.add(pattern)
+            patterns.append(pattern)
+    return text, patterns
+
+def generate_graph_input(category, size, rng=None, negative_weights=False):
+    """Random connected CSR graph with ``size`` nodes plus a start node.
+
+    A random spanning tree (each node joins an earlier one) guarantees
+    connectivity, and about ``size`` extra random edges give an average
+    degree near four, so graphs of 100k+ nodes generate in about a second.
+    - "graph": undirected, unweighted, random start
+    - "shortest path": directed, weights 1-20, tree edges point away from
+      node 0, which is the start
+    - "mst": undirected, weights 1-25, start 0 (for Prim)
+    With ``negative_weights`` the shortest path weights are shifted by node
+    potentials (w + p[u] - p[v], p in 0-15): some edges turn negative, but
+    every cycle keeps its positive weight, so there is no negative cycle.
+    """
+    rng = rng or random.Random()
+    n = max(1, size)
+    pairs = set()
+    sources, targets = [], []
+    for v in range(1, n):
+        u = rng.randrange(v)
+        pairs.add((u, v))
+        sources.append(u)
+        targets.append(v)
+    for _ in range(n if n > 2 else 0):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v and (u, v) not in pairs and (v, u) not in pairs:
+            pairs.add((u, v))
+            sources.append(u)
+            targets.append(v)
+
+    if category == "graph":
+        return CSRGraph.from_arrays(n, sources, targets, directed=False), rng.randrange(n)
+    if category == "shortest path":
+        weights = [rng.randint(1, 20) for _ in sources]
+        if negative_weights:
+            potential = [rng.randint(0, 15) for _ in range(n)]
+            weights = [w + potential[u] - potential[v] for u, v, w in zip(sources, targets, weights)]
+        return CSRGraph.from_arrays(n, sources, targets, weights, directed=True), 0
+    weights = [rng.randint(1, 25) for _ in sources]
+    return CSRGraph.from_arrays(n, sources, targets, weights, directed=False), 0
+
+_EDGE_PATTERN = re.compile(r"^\s*(\w+)\s*-\s*(\w+)(?:\(([-+]?\d+(?:\.\d+)?)\))?\s*$")
+
+def _parse_edge(edge):
+    """Edge tuple from ``(u, v[, w])`` or a UI string like ``"A-B(3)"``."""
+    if isinstance(edge, str):
+        match = _EDGE_PATTERN.match(edge)
+        if not match:
+            raise ValueError(f"Unrecognized edge {edge!r}")
+        a, b, w = match.groups()
+        weight = float(w) if w else 1
+        return a, b, int(weight) if weight == int(weight) else weight
+    return tuple(edge)
+
+def graph_args(input_data):
+    """``(graph, start)`` from generated or custom graph input.
+
+    Accepts ``(graph, start)`` pairs (CSRGraph or dict adjacency), the UI's
+    ``[edges, nodes]`` lists and ``{"graph": {"nodes", "edges"}, "start"}``.
+    Edge lists become undirected CSR graphs with the node names as labels.
+    A ``target`` (third tuple item or ``"target"`` key) makes it a
+    point-to-point query: ``(graph, start, target)``.
+    """
+    if isinstance(input_data, dict):
+        spec = input_data.get("graph") or {}
+        edges, nodes, start = spec.get("edges", []), spec.get("nodes"), input_data.get("start")
+        target = input_data.get("target")
+    else:
+        graph, second, *rest = input_data
+        target = rest[0] if rest else None
+        if not isinstance(graph, (list, tuple)):
+            return (graph, second) if target is None else (graph, second, target)
+        edges, nodes, start = graph, second, None
+    nodes = list(nodes or [])
+    graph = CSRGraph.from_edges([_parse_edge(edge) for edge in edges], nodes or None)
+    if start is None and graph.n:
+        start = graph.label(0)
+    return (graph, start) if target is None else (graph, start, target)
+
+def write_text_file(path, size, seed=None, alphabet="abcdefghijklmnopqrstuvwxyz",
+                    block_size=1 << 20):
+    """Write ``size`` random letters to ``path`` for large-text matching.
+
+    Generated a block at a time from random bytes mapped onto ``alphabet``
+    (one ``bytes.translate`` per block), so gigabyte files take seconds and
+    constant memory. Returns ``path``.
+    """
+    rng = random.Random(seed)
+    symbols = alphabet.encode("ascii")
+    table = bytes(symbols[b % len(symbols)] for b in range(256))
+    with open(path, "wb") as f:
+        remaining = size
+        while remaining > 0:
+            n = min(block_size, remaining)
+            f.write(rng.randbytes(n).translate(table))
+            remaining -= n
+    return path
 
 def get_unified_input(category, input_data, size=None, custom=False):
     """Return properly formatted input for each algorithm category."""
@@ -161,17 +300,12 @@ def get_unified_input(category, input_data, size=None, custom=False):
         text, pattern = input_data
         return (text, pattern)  # Two arguments: text, pattern
         
-    elif category == "graph":
-        graph, start_node = input_data
-        return (graph, start_node)  # Two arguments: graph, start_node
-        
-    elif category == "shortest path":
-        graph, start_node = input_data
-        return (graph, start_node)  # Two arguments: weighted_graph, start_node
-        
-    elif category == "mst":
-        edges, nodes = input_data
-        return (edges,)  # Single argument: edge_list
+    elif category == "multi-pattern matching":
+        text, patterns = input_data
+        return (text, patterns)  # Two arguments: text, list of patterns
+
+    elif category in ("graph", "shortest path", "mst"):
+        return graph_args(input_data)  # graph, start_node (and target for point-to-point)
         
     elif category == "subset generation":
         return (input_data,)  # Single argument: array
@@ -3,41 +3,32 @@ Hybrid approach: Compare multiple implementations of the same algorithm
 """
 from algorithms.sorting import bubble_sort as custom_bubble_sort
 from algorithms.standard_library import python_builtin_sort
+from algorithms.library import registry, TIERS
 import time
 
-# Algorithm categories with multiple implementations
-ALGORITHM_IMPLEMENTATIONS = {
-    "sorting": {
-        "Bubble Sort": {
-            "custom": custom_bubble_sort,
-            "description": "Manual implementation"
-        },
-        "Python Built-in Sort": {
-            "builtin": python_builtin_sort,
-            "description": "Python's optimized Timsort"
-        },
-        "NumPy Sort": {
-            "numpy": None,  # Would load numpy_sort if numpy is available
-            "description": "NumPy's optimized sort"
-        }
-    },
-    "searching": {
-        "Linear Search": {
-            "custom": None,  # Your custom implementation
-            "builtin": None,  # Python's 'in' operator or list.index()
-        },
-        "Binary Search": {
-            "custom": None,  # Your custom implementation  
-            "builtin": None,  # Python's bisect module
-        }
-    }
-}
+
+def _implementations():
+    """Algorithms that declare more than one tier, keyed by display name."""
+    table = {}
+    for category in registry.categories:
+        for entry in registry.entries(category):
+            if len(entry["tiers"]) < 2:
+                continue
+            options = {tier: registry.find(category, entry["key"], tier=tier)["func"]
+                       for tier in entry["tiers"]}
+            options["description"] = entry.get("description", "")
+            table.setdefault(category, {})[entry["name"]] = options
+    return table
+
+
+# Algorithm categories with multiple implementations (see algorithms.library tiers)
+ALGORITHM_IMPLEMENTATIONS = _implementations()
 
 class AlgorithmBattleSystem:
     """Enhanced battle system with multiple implementation options"""
     
     def __init__(self):
-        self.available_implementations = ["custom", "builtin", "numpy", "scipy"]
+        self.available_implementations = list(TIERS)
     
     def get_algorithm_options(self, category: str) -> dict:
         """Get all available implementations for a category"""
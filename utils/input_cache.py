@@ -0,0 +1,138 @@
+"""
+Seeded battle inputs with an LRU cache and background pre-generation
+"""
+import random
+import sys
+import threading
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .helpers import generate_input, DEFAULT_PROFILE
+
+
+def deep_sizeof(obj, _seen=None):
+    """Approximate memory footprint of a generated input in bytes."""
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, _seen) + deep_sizeof(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, _seen) for item in obj)
+    return size
+
+
+class InputCache:
+    """LRU cache of generated inputs bounded by total size in bytes.
+
+    ``get`` always returns ``(seed, data)``. Seeded requests are reproducible
+    and served from the cache. Unseeded requests get a fresh random seed; for
+    popular ``(category, size, profile)`` combinations a background worker
+    keeps ``stock`` ready-made instances so generation stays off the request
+    path. Cached inputs are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, stock=4, popular=8):
+        self.max_bytes = max_bytes
+        self.stock = stock
+        self.popular = popular
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (data, nbytes)
+        self._bytes = 0
+        self._demand = Counter()
+        self._ready = {}  # (category, size, profile) -> deque of (seed, data)
+        self._refilling = set()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="input-pregen")
+
+    def get(self, category, size, seed=None, profile=DEFAULT_PROFILE):
+        category = category.lower()
+        if seed is None:
+            return self._take_fresh(category, size, profile)
+        key = (category, size, seed, profile)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return seed, entry[0]
+            self.misses += 1
+        data = generate_input(category, size, seed=seed, profile=profile)
+        self._store(key, data)
+        return seed, data
+
+    def _store(self, key, data):
+        nbytes = deep_sizeof(data)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (data, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def _take_fresh(self, category, size, profile):
+        shape = (category, size, profile)
+        with self._lock:
+            self._demand[shape] += 1
+            ready = self._ready.get(shape)
+            item = ready.popleft() if ready else None
+            is_popular = shape in dict(self._demand.most_common(self.popular))
+        if item is None:
+            seed = random.getrandbits(32)
+            item = (seed, generate_input(category, size, seed=seed, profile=profile))
+        # Remember it so a rematch with the reported seed is a cache hit
+        self._store((category, size, item[0], profile), item[1])
+        if is_popular:
+            self._schedule_refill(shape)
+        return item
+
+    def _schedule_refill(self, shape):
+        with self._lock:
+            if shape in self._refilling:
+                return
+            self._refilling.add(shape)
+        self._pool.submit(self._refill, shape)
+
+    def _refill(self, shape):
+        category, size, profile = shape
+        try:
+            while True:
+                with self._lock:
+                    ready = self._ready.setdefault(shape, deque())
+                    if len(ready) >= self.stock:
+                        return
+                seed = random.getrandbits(32)
+                data = generate_input(category, size, seed=seed, profile=profile)
+                with self._lock:
+                    ready.append((seed, data))
+        finally:
+            with self._lock:
+                self._refilling.discard(shape)
+
+    def prewarm(self, shapes):
+        """Queue background generation for ``(category, size, profile)`` shapes."""
+        for category, size, profile in shapes:
+            self._schedule_refill((category.lower(), size, profile))
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'ready': {f"{c}/{s}/{p}": len(q) for (c, s, p), q in self._ready.items()},
+            }
+
+
+# Process-wide cache used by the web server
+input_cache = InputCache()
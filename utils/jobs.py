@@ -0,0 +1,154 @@
+"""
+Asynchronous battle jobs: a bounded queue drained by a fixed number of workers
+"""
+import queue
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+
+try:
+    from greenlet import getcurrent as current_worker
+except ImportError:  # no green threads: the OS thread identifies the worker
+    current_worker = threading.get_ident
+
+
+class QueueFull(Exception):
+    """Raised when the battle queue has no room for another job."""
+
+
+class BattleJob:
+    """A single queued battle and its outcome."""
+
+    def __init__(self, payload, room_code=None, sids=()):
+        self.job_id = uuid.uuid4().hex
+        self.payload = payload
+        self.room_code = room_code
+        self.sids = set(sids)
+        self.status = 'queued'  # queued -> running -> done | failed | cancelled
+        self.result = None
+        self.error = None
+        self.worker = None  # current_worker() of the worker running the job
+        self.created_at = datetime.now()
+        self.finished_at = None
+
+    def to_dict(self):
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'room_code': self.room_code,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at.isoformat(),
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class BattleJobQueue:
+    """Runs battles on ``concurrency`` workers with at most ``max_queue`` waiting.
+
+    ``handler(payload)`` must return ``(results, status_code)`` like
+    ``app.run_battle``; ``on_complete(job)`` is called after every job that
+    was not cancelled and ``on_cancel(job)`` for a job cancelled while
+    running, to stop its work. ``spawn`` starts a worker (e.g.
+    ``socketio.start_background_task``) and defaults to a daemon thread;
+    ``make_queue(maxsize)`` builds the pending queue and must match it, since
+    a stdlib queue would block an eventlet hub while workers wait for jobs.
+    """
+
+    def __init__(self, handler, on_complete=None, concurrency=2, max_queue=16,
+                 spawn=None, history=256, on_cancel=None, make_queue=queue.Queue):
+        self.handler = handler
+        self.on_complete = on_complete
+        self.on_cancel = on_cancel
+        self.concurrency = concurrency
+        self.history = history
+        self._pending = make_queue(max_queue)
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._spawn = spawn or self._spawn_thread
+        self._started = False
+
+    @staticmethod
+    def _spawn_thread(target):
+        worker = threading.Thread(target=target, daemon=True)
+        worker.start()
+        return worker
+
+    def _start_workers(self):
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        for _ in range(self.concurrency):
+            self._spawn(self._worker)
+
+    def submit(self, payload, room_code=None, sids=()):
+        """Queue a battle and return its job; raises QueueFull when saturated."""
+        self._start_workers()
+        job = BattleJob(payload, room_code=room_code, sids=sids)
+        try:
+            self._pending.put_nowait(job)
+        except queue.Full:
+            raise QueueFull(f"{self._pending.maxsize} battles already waiting")
+        with self._lock:
+            self._jobs[job.job_id] = job
+            # Only keep a bounded history of finished jobs for polling
+            while len(self._jobs) > self.history:
+                oldest_id, oldest = next(iter(self._jobs.items()))
+                if oldest.status in ('queued', 'running'):
+                    break
+                del self._jobs[oldest_id]
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel_for_sid(self, sid):
+        """Cancel every unfinished job a disconnected participant belongs to.
+
+        Queued jobs are skipped by the workers; a job that is already running
+        is handed to ``on_cancel`` to stop it, and its result is dropped.
+        """
+        cancelled, running = [], []
+        with self._lock:
+            for job in self._jobs.values():
+                if sid in job.sids and job.status in ('queued', 'running'):
+                    if job.status == 'running':
+                        running.append(job)
+                    job.status = 'cancelled'
+                    job.finished_at = datetime.now()
+                    cancelled.append(job)
+        if self.on_cancel:
+            for job in running:
+                self.on_cancel(job)
+        return cancelled
+
+    def _worker(self):
+        while True:
+            job = self._pending.get()
+            try:
+                with self._lock:
+                    if job.status == 'cancelled':
+                        continue
+                    job.status = 'running'
+                    job.worker = current_worker()
+                try:
+                    results, status_code = self.handler(job.payload)
+                except Exception as e:
+                    results, status_code = {'error': str(e)}, 500
+                with self._lock:
+                    if job.status == 'cancelled':
+                        continue
+                    if status_code == 200:
+                        job.status = 'done'
+                        job.result = results
+                    else:
+                        job.status = 'failed'
+                        job.error = results.get('error')
+                    job.finished_at = datetime.now()
+                if self.on_complete:
+                    self.on_complete(job)
+            finally:
+                self._pending.task_done()
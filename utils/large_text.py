@@ -0,0 +1,89 @@
+"""
+Chunk-parallel string matching over memory-mapped files.
+
+The file is mapped read-only and split into chunks that overlap by
+``len(pattern) - 1`` bytes, so every match lies entirely inside at least one
+chunk. Worker processes map the file themselves and hand the matcher a
+``memoryview`` of their chunk, so no chunk is copied or pickled; only the
+match offsets travel back. Any single-pattern matcher from the "string
+matching" category can be used.
+"""
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms.string_matching import kmp_search
+from .executor import _available_cores
+from .trace import tracer, INFO
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def plan_chunks(length, pattern_length, chunk_size=DEFAULT_CHUNK_SIZE):
+    """``(start, end)`` byte ranges covering ``length`` with ``pattern_length - 1`` overlap.
+
+    Chunk k owns the match start positions ``[k * chunk_size, (k + 1) * chunk_size)``.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    overlap = max(pattern_length - 1, 0)
+    last_start = max(length - pattern_length, 0)
+    return [(start, min(length, start + chunk_size + overlap))
+            for start in range(0, last_start + 1, chunk_size)]
+
+
+def _scan_chunk(path, start, end, pattern, matcher):
+    """Worker body: map the file, run ``matcher`` on one chunk in place."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as whole, whole[start:end] as chunk:
+            matches, comparisons = matcher(chunk, pattern)
+    if isinstance(matches, tuple):
+        matches = matches[0]  # (matches, stats) shape, e.g. rabin_karp_64
+    return [start + offset for offset in matches], comparisons
+
+
+def merge_offsets(chunk_results):
+    """Concatenate per-chunk offsets (in chunk order) into one sorted, de-duplicated list."""
+    merged = []
+    comparisons = 0
+    for offsets, count in chunk_results:
+        comparisons += count
+        for offset in offsets:
+            if not merged or offset > merged[-1]:
+                merged.append(offset)
+    return merged, comparisons
+
+
+def search_file(path, pattern, matcher=kmp_search, chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    """Find every occurrence of ``pattern`` in the file at ``path``.
+
+    ``pattern`` may be ``str`` (encoded as UTF-8) or bytes. Chunks are scanned
+    by ``workers`` processes (default: one per available core). Returns
+    ``(offsets, comparisons)`` with byte offsets in ascending order.
+    """
+    if isinstance(pattern, str):
+        pattern = pattern.encode("utf-8")
+    if not pattern:
+        raise ValueError("pattern must not be empty")
+    length = os.path.getsize(path)
+    if length < len(pattern):
+        return [], 0
+
+    chunks = plan_chunks(length, len(pattern), chunk_size)
+    workers = min(workers or len(_available_cores()), len(chunks))
+    if workers <= 1:
+        results = [_scan_chunk(path, start, end, pattern, matcher) for start, end in chunks]
+    else:
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            futures = [pool.submit(_scan_chunk, path, start, end, pattern, matcher)
+                       for start, end in chunks]
+            results = [future.result() for future in futures]
+    offsets, comparisons = merge_offsets(results)
+
+    if tracer.enabled(INFO):
+        tracer.event(INFO, 'large_text.done', path=path, bytes=length, chunks=len(chunks),
+                     workers=workers, matcher=matcher.__name__, matches=len(offsets))
+    return offsets, comparisons
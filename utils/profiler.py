@@ -1,65 +1,67 @@
+import gc
+import multiprocessing
+import signal
 import time
 import tracemalloc
 
-def run_algorithm(func, *args):
+try:
+    import resource
+except ImportError:  # Not available on Windows: only the wall-clock deadline applies
+    resource = None
+
+from .trace import tracer, short_repr, DEBUG, WARNING, ERROR
+
+TIMED_OUT = "timed out"
+OUT_OF_MEMORY = "out of memory"
+
+
+class LimitExceeded(Exception):
+    """Result placeholder for a contestant stopped by a sandbox limit."""
+
+    def __init__(self, outcome, detail=""):
+        super().__init__(f"{outcome}: {detail}" if detail else outcome)
+        self.outcome = outcome
+
+    def __reduce__(self):
+        return (LimitExceeded, (self.outcome,))
+
+
+def run_algorithm(func, *args, limits=None):
+    """Run ``func(*args)`` and return ``(time_taken, memory_used, is_correct, result)``.
+
+    When ``limits`` is given (see ``run_sandboxed``) the call runs in a
+    throwaway child process under CPU, address-space and wall-clock limits.
+    A ``func.prepare(*args)`` hook, if present, runs before the timer starts.
+    """
+    if limits is not None:
+        return run_sandboxed(func, args, **limits)
+
+    call_args = _call_args(func, args)
+    prepare = getattr(func, 'prepare', None)
+    if prepare is not None:
+        # Per-input setup such as a search index is not part of the query
+        try:
+            prepare(*call_args)
+        except Exception:
+            # Bad input: the timed call below fails and reports it
+            pass
+    if tracer.enabled(DEBUG):
+        tracer.event(DEBUG, 'algorithm.start', func=func.__name__,
+                     arg_types=[type(arg).__name__ for arg in call_args],
+                     args=short_repr(call_args))
+
     tracemalloc.start()
     start_time = time.perf_counter()
 
     try:
-        # Debug output to see what we're actually getting
-        func_name = func.__name__.lower()
-        print(f"DEBUG: Function name: {func_name}")
-        print(f"DEBUG: Raw args received: {args}")
-        print(f"DEBUG: Args length: {len(args)}")
-        if len(args) > 0:
-            print(f"DEBUG: First arg type: {type(args[0])}")
-            print(f"DEBUG: First arg value: {args[0]}")
-        
-        is_sorting = any(sort_type in func_name for sort_type in 
-                        ['sort', 'bubble', 'insertion', 'merge', 'quick', 'selection', 'heap'])
-        is_subset = any(subset_type in func_name for subset_type in
-                       ['subset', 'backtrack', 'bitmask'])
-        
-        print(f"DEBUG: Is sorting: {is_sorting}")
-        print(f"DEBUG: Is subset: {is_subset}")
-        
-        if is_sorting:
-            # For sorting algorithms, we need to reconstruct the list from individual args
-            if len(args) > 1 and all(isinstance(arg, (int, float)) for arg in args):
-                # If we got individual numbers, put them back into a list
-                array_to_sort = list(args)
-                print(f"DEBUG: Reconstructed sorting array: {array_to_sort}")
-                result = func(array_to_sort)
-            elif len(args) == 1 and isinstance(args[0], list):
-                # If we got a proper list, use it directly
-                print(f"DEBUG: Using list directly for sorting: {args[0]}")
-                result = func(args[0])
-            else:
-                # Fallback
-                print(f"DEBUG: Using fallback for sorting")
-                result = func(*args)
-        elif is_subset:
-            # For subset generation algorithms, pass the array as a single argument
-            if len(args) == 1 and isinstance(args[0], list):
-                print(f"DEBUG: Passing list to subset function: {args[0]}")
-                result = func(args[0])
-            elif len(args) > 1 and all(isinstance(arg, (int, float)) for arg in args):
-                # If we got individual numbers, put them back into a list
-                array_for_subsets = list(args)
-                print(f"DEBUG: Reconstructed subset array: {array_for_subsets}")
-                result = func(array_for_subsets)
-            else:
-                print(f"DEBUG: Using fallback for subset generation")
-                result = func(*args)
-        else:
-            # For non-sorting, non-subset algorithms, use normal unpacking
-            print(f"DEBUG: Using normal unpacking")
-            result = func(*args)
-            
-        print(f"DEBUG: Function result: {result}")
+        result = func(*call_args)
         is_correct = True
+    except MemoryError:
+        tracer.event(ERROR, 'algorithm.failed', func=func.__name__, error=OUT_OF_MEMORY)
+        result = LimitExceeded(OUT_OF_MEMORY)
+        is_correct = False
     except Exception as e:
-        print(f"Algorithm failed with error: {e}")
+        tracer.event(ERROR, 'algorithm.failed', func=func.__name__, error=str(e))
         result = None
         is_correct = False
 
@@ -70,4 +72,338 @@ def run_algorithm(func, *args):
     time_taken = end_time - start_time
     memory_used = peak / 10**6  # MB
 
-    return time_taken, memory_used, is_correct, result
\ No newline at end of file
+    if tracer.enabled(DEBUG):
+        tracer.event(DEBUG, 'algorithm.done', func=func.__name__, time=time_taken,
+                     memory_mb=memory_used, result=short_repr(result))
+
+    return time_taken, memory_used, is_correct, result
+
+
+def _call_args(func, args):
+    """Shape the positional arguments the way each algorithm family expects.
+
+    Sorting and subset generation take a single list; if it arrives spread
+    out as individual numbers, it is put back together. Done before the timer
+    starts so dispatch is not billed to the algorithm.
+    """
+    func_name = func.__name__.lower()
+    is_sorting = any(sort_type in func_name for sort_type in
+                     ['sort', 'bubble', 'insertion', 'merge', 'quick', 'selection', 'heap'])
+    is_subset = any(subset_type in func_name for subset_type in
+                    ['subset', 'backtrack', 'bitmask'])
+    if (is_sorting or is_subset) and len(args) > 1 \
+            and all(isinstance(arg, (int, float)) for arg in args):
+        # If we got individual numbers, put them back into a list
+        return (list(args),)
+    return args
+
+
+# --- Sandboxed execution -----------------------------------------------------
+
+def _address_space_in_use():
+    """Current virtual memory size of this process in bytes (0 if unknown)."""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmSize:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def _sandbox_child(conn, target, args, cpu_seconds, memory_mb):
+    """Child process body: apply rlimits, run ``target(*args)``, send back its return value."""
+    if resource is not None:
+        if cpu_seconds:
+            cpu = int(cpu_seconds) + 1
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+        if memory_mb:
+            # Budget on top of what the interpreter already maps
+            limit = _address_space_in_use() + int(memory_mb * 1024 * 1024)
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    # Only this run's events go back to the parent
+    tracer.drain()
+    try:
+        conn.send((target(*args), tracer.drain()))
+    except MemoryError:
+        conn.send((LimitExceeded(OUT_OF_MEMORY), []))
+    except Exception as e:
+        # e.g. a result that cannot be pickled back to the parent
+        tracer.event(ERROR, 'sandbox.unreportable', func=target.__name__, error=str(e))
+        conn.send((None, tracer.drain()))
+    finally:
+        conn.close()
+
+
+def _run_in_sandbox(target, args, name, cpu_seconds=10, memory_mb=512, wall_seconds=15):
+    """Run ``target(*args)`` in a fresh child process under hard limits.
+
+    Returns ``(value, elapsed)``. ``value`` is the child's return value, a
+    ``LimitExceeded`` if a limit stopped it, or None if the value could not be
+    sent back. The parent enforces ``wall_seconds`` and kills the child when
+    it expires.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    child = ctx.Process(target=_sandbox_child,
+                        args=(child_conn, target, args, cpu_seconds, memory_mb),
+                        daemon=True)
+    start_time = time.perf_counter()
+    child.start()
+    child_conn.close()
+
+    outcome = None
+    try:
+        if parent_conn.poll(wall_seconds):
+            value, events = parent_conn.recv()
+            tracer.ingest(events)
+            return value, time.perf_counter() - start_time
+        outcome = TIMED_OUT
+    except (EOFError, OSError):
+        # Child died without reporting: CPU limit signal or allocation failure
+        child.join(1)
+        if child.exitcode in (-signal.SIGXCPU, -signal.SIGKILL):
+            outcome = TIMED_OUT
+        else:
+            outcome = OUT_OF_MEMORY
+    finally:
+        parent_conn.close()
+        if child.is_alive():
+            child.kill()
+        child.join()
+
+    elapsed = time.perf_counter() - start_time
+    tracer.event(WARNING, 'sandbox.limit', func=name, outcome=outcome, time=elapsed)
+    return LimitExceeded(outcome), elapsed
+
+
+def run_sandboxed(func, args, cpu_seconds=10, memory_mb=512, wall_seconds=15):
+    """Run one contestant in a fresh child process under hard limits.
+
+    The child gets ``RLIMIT_CPU`` and ``RLIMIT_AS`` budgets; the parent
+    enforces ``wall_seconds`` and kills the child when it expires. A
+    contestant that hits a limit is reported as an incorrect run whose result
+    is a ``LimitExceeded`` with outcome ``TIMED_OUT`` or ``OUT_OF_MEMORY``,
+    so it is scored like any other failure instead of taking the server down.
+    """
+    value, elapsed = _run_in_sandbox(run_algorithm, (func, *args), func.__name__,
+                                     cpu_seconds, memory_mb, wall_seconds)
+    if isinstance(value, LimitExceeded):
+        return elapsed, 0.0, False, value
+    if value is None:
+        return 0.0, 0.0, False, None
+    return value
+
+
+# --- Multi-trial timing mode -------------------------------------------------
+
+def _autorange(func, args, min_time):
+    """Find how many calls make one trial last at least ``min_time`` seconds.
+
+    Same 1, 2, 5, 10, 20, 50, ... scaling as ``timeit.Timer.autorange``.
+    """
+    loops = 1
+    while True:
+        for factor in (1, 2, 5):
+            number = loops * factor
+            start = time.perf_counter()
+            for _ in range(number):
+                func(*args)
+            if time.perf_counter() - start >= min_time:
+                return number
+        loops *= 10
+
+
+def _timed_trial(func, args, loops):
+    """Run one trial of ``loops`` calls; return per-call (wall, cpu) seconds."""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for _ in range(loops):
+        func(*args)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    return wall / loops, cpu / loops
+
+
+def _percentile(sorted_samples, q):
+    """Linear-interpolated percentile of an already sorted list."""
+    if len(sorted_samples) == 1:
+        return sorted_samples[0]
+    pos = (len(sorted_samples) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_samples) - 1)
+    return sorted_samples[lo] + (sorted_samples[hi] - sorted_samples[lo]) * (pos - lo)
+
+
+def summarize_samples(samples, z=1.96):
+    """Median, IQR and a distribution-free confidence interval for the median.
+
+    The interval uses the binomial order-statistic ranks n/2 -/+ z*sqrt(n)/2,
+    so it makes no normality assumption about timing noise.
+    """
+    s = sorted(samples)
+    n = len(s)
+    half_width = z * (n ** 0.5) / 2
+    lo_rank = max(0, int(n / 2 - half_width))
+    hi_rank = min(n - 1, int(n / 2 + half_width + 0.5))
+    return {
+        'median': _percentile(s, 0.5),
+        'iqr': _percentile(s, 0.75) - _percentile(s, 0.25),
+        'ci_low': s[lo_rank],
+        'ci_high': s[hi_rank],
+        'min': s[0],
+        'max': s[-1],
+    }
+
+
+def measure(func, args, trials=7, warmup=1, min_trial_time=0.002, limits=None):
+    """Timing distribution of ``func(*args)`` on its own (no opponent).
+
+    Same procedure as ``run_trials``: warmup, timeit-style loop scaling and
+    GC disabled while timing. Returns the wall-clock summary with a ``cpu``
+    summary, ``loops`` and ``trials``.
+
+    With ``limits`` (see ``run_sandboxed``) the whole measurement runs in one
+    sandbox child under those budgets, unscaled, and returns a
+    ``LimitExceeded`` if it is stopped or None if it fails.
+    """
+    if limits is not None:
+        timing, _ = _run_in_sandbox(measure, (func, args, trials, warmup, min_trial_time),
+                                    func.__name__, **limits)
+        return timing
+    for _ in range(warmup):
+        func(*args)
+    loops = _autorange(func, args, min_trial_time)
+    wall, cpu = [], []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(trials):
+            w, c = _timed_trial(func, args, loops)
+            wall.append(w)
+            cpu.append(c)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    timing = summarize_samples(wall)
+    timing['cpu'] = summarize_samples(cpu)
+    timing['loops'] = loops
+    timing['trials'] = trials
+    return timing
+
+
+def run_trials(func1, args1, func2, args2, trials=15, warmup=2, min_trial_time=0.002,
+               limits=None):
+    """Time two contestants over many interleaved trials.
+
+    Each contestant is warmed up, its loop count is scaled timeit-style so a
+    trial is long enough to measure, and then trials alternate A, B, A, B, ...
+    with the garbage collector disabled so drift and GC pauses hit both sides
+    equally. Peak memory is measured in a separate traced call because
+    tracemalloc would otherwise distort the timings.
+
+    Returns two ``(timing, memory_used, is_correct, result)`` tuples where
+    ``timing`` is a dict with the wall-clock summary (``median``, ``iqr``,
+    ``ci_low``, ``ci_high``, ...), a ``cpu`` summary of process time,
+    ``loops`` and ``trials``.
+
+    With ``limits`` every call runs sandboxed: the traced runs one by one
+    under the per-call budgets, then the whole timing phase in one child
+    whose CPU and wall budgets cover all its calls (``_trial_limits``). If
+    that child is stopped, each contestant is timed again on its own sandbox
+    so the limit is charged to the one that exceeded it. A contestant that
+    fails or exceeds a limit is not timed further.
+    """
+    contestants = [(func1, args1), (func2, args2)]
+    outcomes = []
+    for func, args in contestants:
+        # The first traced run doubles as the correctness/result run
+        time_taken, memory_used, is_correct, result = run_algorithm(func, *args, limits=limits)
+        outcomes.append([memory_used, is_correct, result])
+
+    active = [is_correct for _, is_correct, _ in outcomes]
+    options = (trials, warmup, min_trial_time)
+    if limits is None:
+        loops, wall, cpu = _timing_phase(contestants, active, *options)
+    else:
+        phase_limits = _trial_limits(limits, sum(active), trials, warmup)
+        timed, _ = _run_in_sandbox(_timing_phase, (contestants, active) + options,
+                                   'run_trials', **phase_limits)
+        if isinstance(timed, tuple):
+            loops, wall, cpu = timed
+        else:
+            # Time each contestant alone to find out which one exceeded the limits
+            loops, wall, cpu = [0, 0], [[], []], [[], []]
+            for i in range(len(contestants)):
+                if not active[i]:
+                    continue
+                only = [j == i for j in range(len(contestants))]
+                timed, _ = _run_in_sandbox(_timing_phase, (contestants, only) + options,
+                                           contestants[i][0].__name__,
+                                           **_trial_limits(limits, 1, trials, warmup))
+                if isinstance(timed, tuple):
+                    loops[i], wall[i], cpu[i] = timed[0][i], timed[1][i], timed[2][i]
+                else:
+                    outcomes[i][1:] = [False, timed if isinstance(timed, LimitExceeded) else None]
+
+    results = []
+    for i, (memory_used, is_correct, result) in enumerate(outcomes):
+        if wall[i]:
+            timing = summarize_samples(wall[i])
+            timing['cpu'] = summarize_samples(cpu[i])
+        else:
+            # Failed contestants are not timed; report an empty distribution
+            timing = {'median': 0.0, 'iqr': 0.0, 'ci_low': 0.0, 'ci_high': 0.0,
+                      'min': 0.0, 'max': 0.0, 'cpu': None}
+        timing['loops'] = loops[i]
+        timing['trials'] = len(wall[i])
+        results.append((timing, memory_used, is_correct, result))
+    return results[0], results[1]
+
+
+def _trial_limits(limits, contestants, trials, warmup):
+    """Sandbox budgets for a timing phase: the per-call CPU and wall budgets
+    scaled by the calls it makes (warmup, autorange and trials per
+    contestant); the memory budget is unchanged.
+    """
+    calls = max(1, contestants) * (warmup + trials + 2)
+    scaled = dict(limits)
+    for budget in ('cpu_seconds', 'wall_seconds'):
+        if scaled.get(budget):
+            scaled[budget] = scaled[budget] * calls
+    return scaled
+
+
+def _timing_phase(contestants, active, trials, warmup, min_trial_time):
+    """Warmup, loop scaling and interleaved trials of the ``active`` contestants.
+
+    Returns ``(loops, wall, cpu)`` lists indexed like ``contestants``.
+    """
+    loops = []
+    for (func, args), is_active in zip(contestants, active):
+        if not is_active:
+            loops.append(0)
+            continue
+        for _ in range(warmup):
+            func(*args)
+        loops.append(_autorange(func, args, min_trial_time))
+
+    wall = [[] for _ in contestants]
+    cpu = [[] for _ in contestants]
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(trials):
+            for i, (func, args) in enumerate(contestants):
+                if loops[i]:
+                    w, c = _timed_trial(func, args, loops[i])
+                    wall[i].append(w)
+                    cpu[i].append(c)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return loops, wall, cpu
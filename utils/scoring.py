@@ -1,8 +1,46 @@
+from .trace import tracer, DEBUG
+
+
+def central_time(timing):
+    """Median of a timing distribution, or the timing itself if it is a float."""
+    if isinstance(timing, dict):
+        return timing['median']
+    return timing
+
+
+def intervals_overlap(timing1, timing2):
+    """True when two timing distributions are statistically indistinguishable.
+
+    Single float timings never overlap unless they are equal.
+    """
+    if not isinstance(timing1, dict) or not isinstance(timing2, dict):
+        return central_time(timing1) == central_time(timing2)
+    return timing1['ci_low'] <= timing2['ci_high'] and timing2['ci_low'] <= timing1['ci_high']
+
+
+def reference_value(*contestants):
+    """Best (smallest) positive time or memory among correct contestants, 0.0 if none.
+
+    ``contestants`` are ``(value, correct)`` pairs; values may be timing
+    distributions. A failed contestant reports 0 (an untimed run in trials
+    mode), which would otherwise become the reference and zero every
+    normalized score.
+    """
+    values = [central_time(value) for value, correct in contestants if correct]
+    return min((v for v in values if v > 0), default=0.0)
+
+
 def score_algorithm(correct, time_taken, memory_used, fastest_time, lowest_memory,
                     Wc=0.5, Wt=0.3, Wm=0.2):
     """
     Fixed scoring with debug output
+
+    ``time_taken`` and ``fastest_time`` may be single timings in seconds or
+    timing distributions from ``run_trials``, in which case their medians are
+    used.
     """
+    time_taken = central_time(time_taken)
+    fastest_time = central_time(fastest_time)
     C = 1.0 if correct else 0.0
     
     # Ensure we don't divide by zero and values are reasonable
@@ -20,8 +58,10 @@ def score_algorithm(correct, time_taken, memory_used, fastest_time, lowest_memor
     
     score = (C * Wc) + (T_norm * Wt) + (M_norm * Wm)
     
-    print(f"SCORE_DEBUG: correct={correct}, time_taken={time_taken:.6f}, memory_used={memory_used:.6f}")
-    print(f"SCORE_DEBUG: fastest_time={fastest_time:.6f}, lowest_memory={lowest_memory:.6f}")
-    print(f"SCORE_DEBUG: C={C}, T_norm={T_norm:.3f}, M_norm={M_norm:.3f}, score={score:.3f}")
+    if tracer.enabled(DEBUG):
+        tracer.event(DEBUG, 'score', correct=correct, time_taken=time_taken,
+                     memory_used=memory_used, fastest_time=fastest_time,
+                     lowest_memory=lowest_memory, C=C, T_norm=T_norm, M_norm=M_norm,
+                     score=score)
     
     return score
\ No newline at end of file
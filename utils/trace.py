@@ -0,0 +1,106 @@
+"""
+Structured trace events with levels, sampling and a bounded in-memory buffer.
+
+Hot paths must guard with ``tracer.enabled(level)`` before building any event
+fields, so a disabled level costs one integer comparison and no formatting.
+"""
+import os
+import random
+import reprlib
+import threading
+import time
+from collections import deque
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVELS = {'debug': DEBUG, 'info': INFO, 'warning': WARNING, 'error': ERROR, 'off': OFF}
+LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+
+# Bounded repr for large inputs/results: a 100k-element list becomes "[1, 2, ...]"
+_short = reprlib.Repr()
+_short.maxlist = _short.maxtuple = _short.maxdict = _short.maxset = 8
+_short.maxstring = _short.maxother = 80
+
+
+def short_repr(value):
+    """Size-bounded repr for trace fields."""
+    return _short.repr(value)
+
+
+def parse_level(level):
+    """Accept a level number or name ('debug', 'info', ...)."""
+    if isinstance(level, int):
+        return level
+    return LEVELS[str(level).lower()]
+
+
+class Tracer:
+    """Collects trace events into a ring buffer of the most recent ``capacity``."""
+
+    def __init__(self, level=WARNING, sample_rate=1.0, capacity=1000):
+        self.level = parse_level(level)
+        self.sample_rate = sample_rate
+        self._events = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def configure(self, level=None, sample_rate=None, capacity=None):
+        if level is not None:
+            self.level = parse_level(level)
+        if sample_rate is not None:
+            self.sample_rate = sample_rate
+        if capacity is not None and capacity != self._events.maxlen:
+            with self._lock:
+                self._events = deque(self._events, maxlen=capacity)
+
+    def settings(self):
+        return {'level': self.level, 'sample_rate': self.sample_rate,
+                'capacity': self._events.maxlen}
+
+    def enabled(self, level):
+        return level >= self.level
+
+    def event(self, level, name, **fields):
+        """Record an event if ``level`` is enabled and the event is sampled in.
+
+        Errors are never sampled out.
+        """
+        if level < self.level:
+            return
+        if level < ERROR and self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        record = {'ts': time.time(), 'level': LEVEL_NAMES.get(level, level),
+                  'event': name, 'pid': os.getpid()}
+        record.update(fields)
+        with self._lock:
+            self._events.append(record)
+
+    def ingest(self, records):
+        """Add events recorded by another process (e.g. a battle worker)."""
+        with self._lock:
+            self._events.extend(records)
+
+    def drain(self):
+        """Remove and return all buffered events."""
+        with self._lock:
+            records = list(self._events)
+            self._events.clear()
+        return records
+
+    def query(self, level=DEBUG, name=None, limit=100):
+        """Most recent events at or above ``level``, optionally filtered by name prefix."""
+        level = parse_level(level)
+        with self._lock:
+            records = list(self._events)
+        matched = [r for r in records
+                   if LEVELS.get(r['level'], 0) >= level
+                   and (name is None or r['event'].startswith(name))]
+        return matched[-limit:] if limit else matched
+
+
+tracer = Tracer(level=os.environ.get('BATTLE_TRACE_LEVEL', 'warning'),
+                sample_rate=float(os.environ.get('BATTLE_TRACE_SAMPLE', 1.0)),
+                capacity=int(os.environ.get('BATTLE_TRACE_CAPACITY', 1000)))
@@ -0,0 +1,236 @@
+"""
+Correctness oracles for battle results, with a process-wide content-addressed cache
+"""
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from itertools import chain, combinations
+
+from algorithms.csr import as_csr, relabel_order
+from algorithms.shortest_path import dijkstra, bellman_ford
+from algorithms.knapsack import knapsack_dp, knapsack_dp_numpy, knapsack_dp_by_value, np
+from .input_cache import deep_sizeof
+from .trace import tracer, ERROR
+
+
+def input_digest(category, data_args):
+    """Stable digest of a category plus its unified input tuple."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(category.lower().encode())
+    h.update(pickle.dumps(data_args, protocol=pickle.HIGHEST_PROTOCOL))
+    return h.hexdigest()
+
+
+class OracleCache:
+    """LRU cache of expected results keyed by ``input_digest``, bounded in bytes."""
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # digest -> (expected, nbytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, category, data_args, compute):
+        try:
+            key = input_digest(category, data_args)
+        except Exception:
+            # Unpicklable input: nothing to key on, just compute it
+            return compute(category, data_args)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        expected = compute(category, data_args)
+        if expected is not None:
+            self._store(key, expected)
+        return expected
+
+    def _store(self, key, expected):
+        nbytes = deep_sizeof(expected)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (expected, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._bytes,
+                    'max_bytes': self.max_bytes, 'hits': self.hits, 'misses': self.misses}
+
+
+oracle_cache = OracleCache()
+
+def _knapsack_reference(values, weights, capacity):
+    """Reference knapsack solver along the cheaper DP dimension.
+
+    Capacity-indexed DP (vectorized when NumPy is available) for ordinary
+    instances, value-indexed DP when the total value is smaller than the
+    capacity, as in the "large" input profile.
+    """
+    if sum(values) < capacity:
+        return knapsack_dp_by_value(values, weights, capacity)
+    if np is not None:
+        return knapsack_dp_numpy(values, weights, capacity)
+    return knapsack_dp(values, weights, capacity)
+
+
+def extract_result_and_comparisons(obj):
+    """Split an algorithm's return value into ``(value, comparisons)``.
+
+    Algorithms may return:
+    - value
+    - (value, comparisons)
+    - ((value, selection), comparisons)  (e.g., knapsack)
+    Tuples/lists are searched recursively for an int comparisons value at the
+    last position; comparisons is 0 if none is found.
+    """
+    # If obj is not tuple/list, it's the value with no comparisons
+    if not isinstance(obj, (list, tuple)):
+        return obj, 0
+    # If tuple/list and last element is int, treat it as comparisons
+    if len(obj) >= 2 and isinstance(obj[-1], int):
+        return obj[0], obj[-1]
+    # Otherwise, try to recurse into the first element
+    if len(obj) >= 1:
+        return extract_result_and_comparisons(obj[0])
+    return obj, 0
+
+
+def _powerset(iterable):
+    s = list(iterable)
+    return chain.from_iterable(combinations(s, r) for r in range(len(s) + 1))
+
+
+def _reachable(graph, start):
+    graph = as_csr(graph)
+    offsets, targets = graph.offsets, graph.targets
+    seen = {graph.node_id(start)}
+    stack = list(seen)
+    while stack:
+        u = stack.pop()
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            if v not in seen:
+                seen.add(v)
+                stack.append(v)
+    return relabel_order(graph, list(seen))
+
+
+def _reference(category, data_args):
+    """Compute the expected result for common categories or None if unknown."""
+    cat = category.lower()
+    try:
+        if cat == 'string matching':
+            # data_args -> (text, pattern)
+            text, pattern = data_args
+            return [i for i in range(len(text)) if text.startswith(pattern, i)]
+
+        if cat == 'multi-pattern matching':
+            # data_args -> (text, patterns); every pattern maps to its offsets
+            text, patterns = data_args
+            return {p: [i for i in range(len(text) - len(p) + 1) if text.startswith(p, i)]
+                    for p in patterns}
+
+        if cat == 'sorting':
+            # data_args -> (arr,)
+            return sorted(data_args[0])
+
+        if cat == 'searching':
+            # data_args -> (arr, target)
+            arr, target = data_args
+            # Many search implementations return an index or -1.
+            # For correctness, consider whether the target exists in the array.
+            if isinstance(target, (list, tuple)):
+                present = set(arr)
+                return [t in present for t in target]
+            return (target in arr)
+
+        if cat == 'graph':
+            # data_args -> (graph, start); any traversal must visit exactly the reachable nodes
+            graph, start = data_args
+            return frozenset(_reachable(graph, start))
+
+        if cat == 'shortest path' and len(data_args) == 3:
+            # data_args -> (graph, start, target); point-to-point queries return the distance
+            # Dijkstra is only exact without negative edges
+            graph = as_csr(data_args[0])
+            negative = graph.weights is not None and min(graph.weights, default=0) < 0
+            (distance, _), _ = (bellman_ford if negative else dijkstra)(graph, *data_args[1:])
+            return distance
+
+        if cat == 'subset generation':
+            # data_args -> (arr,)
+            return [list(x) for x in _powerset(data_args[0])]
+
+        if cat == '0/1 knapsack':
+            # data_args -> (values, weights, capacity); DP is the reference
+            (best_value, _), _ = _knapsack_reference(*data_args)
+            return best_value
+
+    except Exception as e:
+        tracer.event(ERROR, 'oracle.failed', category=category, error=str(e))
+        return None
+
+    return None
+
+
+def compute_expected(category, data_args):
+    """Expected result for ``data_args`` (as returned by get_unified_input).
+
+    Served from ``oracle_cache`` when the same input has been seen before,
+    so rematches and shared-input battles skip the reference computation.
+    """
+    return oracle_cache.get_or_compute(category, data_args, _reference)
+
+
+def check_result(category, result, expected):
+    """Compare an unwrapped algorithm result against ``expected``.
+
+    Returns None when the category has no oracle.
+    """
+    cat = category.lower()
+    if expected is None:
+        return None
+    if cat in ('string matching', 'multi-pattern matching'):
+        # Matchers may return (matches, extra stats) like knapsack's (value, selection)
+        return (isinstance(result, tuple) and result[0] == expected) or (result == expected)
+    if cat == 'sorting':
+        return result == expected
+    if cat == 'searching':
+        # expected is whether the target is in the array (one flag per target for a batch)
+        if isinstance(expected, list):
+            return isinstance(result, list) and [r != -1 for r in result] == expected
+        return (result != -1) == expected
+    if cat == 'graph':
+        # expected is the reachable set; the visit order (first element of an
+        # (order, levels) pair) must cover it once each
+        order = result[0] if isinstance(result, tuple) else result
+        return isinstance(order, list) and len(order) == len(expected) and set(order) == expected
+    if cat == 'shortest path':
+        # expected is the target's distance; results are (distance, settled) pairs
+        return (isinstance(result, tuple) and result[0] == expected) or (result == expected)
+    if cat == 'subset generation':
+        # Compare as sets of tuples to ignore ordering
+        set_res = set(tuple(sorted(x)) for x in result) if result is not None else set()
+        set_exp = set(tuple(sorted(x)) for x in expected)
+        return set_res == set_exp
+    if cat == '0/1 knapsack':
+        # expected is the best value
+        return (isinstance(result, (list, tuple)) and result[0] == expected) or (result == expected)
+    return None